@@ -710,11 +710,11 @@ def _check_sync_group_consistency(
     if len(submodules) < 2:
         return True  # nothing to check with fewer than 2 instances
 
+    # Discovery already read every instance's HEAD in one batch per parent.
     commits = {}
     for sub in submodules:
-        sha = sub.get_current_commit()
-        rel = str(sub.path.relative_to(repo_root))
-        commits[rel] = sha
+        sha = sub.current_commit or sub.get_current_commit()
+        commits[sub.rel_path] = sha
 
     unique_shas = set(commits.values())
     if len(unique_shas) <= 1:
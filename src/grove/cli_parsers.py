@@ -169,6 +169,7 @@ examples:
   grove sync --remote              Resolve target from remote
   grove sync --dry-run             Preview what would happen
   grove sync --no-push             Commit only, skip pushing
+  grove sync --full-fetch          Fetch tags, not just commits
 """,
     )
     sync_parser.add_argument(
@@ -204,6 +205,11 @@ examples:
         dest="skip_checks",
         help="Skip remote sync validation",
     )
+    sync_parser.add_argument(
+        "--full-fetch",
+        action="store_true",
+        help="Fetch tags too (default fetches skip tags)",
+    )
     sync_parser.add_argument(
         "--verbose",
         "-v",
@@ -9,11 +9,63 @@ Provides advisory locking via ``fcntl.flock`` so that multiple worktrees
 from __future__ import annotations
 
 import fcntl
+import functools
+import importlib
+import json
 import os
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from typing import IO, Iterator
+from typing import IO, Any, Iterator
+
+
+@functools.cache
+def _load_orjson():
+    """Return the optional ``orjson`` module, or None when not installed.
+
+    Install with ``pip install grove[json]``.
+    """
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:
+        return None
+
+
+def dumps_json(data: Any) -> str:
+    """Serialise *data* as indented JSON with a trailing newline.
+
+    Uses ``orjson`` when available; the output parses identically either
+    way.
+    """
+    orjson = _load_orjson()
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        ).decode()
+    return json.dumps(data, indent=2) + "\n"
+
+
+def encode_json(data: Any) -> bytes:
+    """Serialise *data* as compact UTF-8 JSON bytes for the wire.
+
+    Uses ``orjson`` when available, which encodes straight to bytes
+    without an intermediate ``str``.
+    """
+    orjson = _load_orjson()
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def loads_json(text: str) -> Any:
+    """Parse JSON *text*, using ``orjson`` when available.
+
+    Malformed input raises ``json.JSONDecodeError`` with either backend.
+    """
+    orjson = _load_orjson()
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 @contextmanager
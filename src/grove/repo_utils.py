@@ -10,6 +10,7 @@ Provides:
 - parse_gitmodules(): Parse .gitmodules files with optional URL filtering
 - discover_repos_from_gitmodules(): Find all git repos via .gitmodules metadata
 - topological_sort_repos(): Sort repos for bottom-up operations
+- topological_levels(): Group repos into bottom-up levels for concurrent work
 - print_status_table(): Formatted status output
 """
 
@@ -19,10 +20,11 @@ import re
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import cached_property
+from functools import cache, cached_property, lru_cache
 from graphlib import TopologicalSorter
 from pathlib import Path
 
@@ -64,6 +66,34 @@ if not (hasattr(sys.stdout, "isatty") and sys.stdout.isatty()):
     Colors.disable()
 
 
+# Parallel jobs for one ``git fetch --all``.  Kept small because callers
+# such as the visualizer's fetch-all already fetch several repos at once.
+FETCH_JOBS = 4
+
+# Upper bound on concurrent git processes when acting on many repos.
+MAX_GIT_WORKERS = 8
+
+
+@cache
+def _git_pool() -> ThreadPoolExecutor:
+    """Return the worker pool shared by every map_concurrently() call."""
+    return ThreadPoolExecutor(
+        max_workers=MAX_GIT_WORKERS, thread_name_prefix="grove-git"
+    )
+
+
+def map_concurrently(fn, items: list) -> list:
+    """Apply *fn* to each of *items* on a thread pool, preserving order.
+
+    The pool is shared, so overlapping callers (e.g. a visualizer fetch-all
+    while a reload is validating) stay within ``MAX_GIT_WORKERS`` git
+    processes between them.  *fn* must not itself call ``map_concurrently``.
+    """
+    if len(items) < 2:
+        return [fn(item) for item in items]
+    return list(_git_pool().map(fn, items))
+
+
 class RepoStatus(Enum):
     """Validation status for a repository."""
 
@@ -124,10 +154,24 @@ def parse_gitmodules(
 
     Returns an empty list when the file is missing or empty.
     """
-    if not gitmodules_path.exists():
+    try:
+        content = gitmodules_path.read_text()
+    except FileNotFoundError:
         return []
 
-    content = gitmodules_path.read_text()
+    entries = _parse_gitmodules_text(content)
+    if url_match is None:
+        return list(entries)
+    return [entry for entry in entries if url_match in entry[2]]
+
+
+@lru_cache(maxsize=256)
+def _parse_gitmodules_text(content: str) -> tuple[tuple[str, str, str], ...]:
+    """Parse .gitmodules *content* into ``(name, path, url)`` tuples.
+
+    Keyed on the file content, so repeated lookups of the same file (one per
+    sync group, plus repo discovery) only pay for the read.
+    """
     results: list[tuple[str, str, str]] = []
 
     current_name: str | None = None
@@ -140,8 +184,7 @@ def parse_gitmodules(
         if line.startswith("[submodule"):
             # Save previous section
             if current_name and current_path and current_url is not None:
-                if url_match is None or url_match in current_url:
-                    results.append((current_name, current_path, current_url))
+                results.append((current_name, current_path, current_url))
             current_name = None
             current_path = None
             current_url = None
@@ -155,10 +198,9 @@ def parse_gitmodules(
 
     # Don't forget the last section
     if current_name and current_path and current_url is not None:
-        if url_match is None or url_match in current_url:
-            results.append((current_name, current_path, current_url))
+        results.append((current_name, current_path, current_url))
 
-    return results
+    return tuple(results)
 
 
 @dataclass
@@ -187,7 +229,7 @@ class RepoInfo:
             return "(root)"
         return str(self.path.relative_to(self.repo_root))
 
-    @property
+    @cached_property
     def depth(self) -> int:
         """Get directory depth for sorting."""
         return len(self.path.parts)
@@ -221,7 +263,8 @@ class RepoInfo:
         When *exclude_submodules* is True, paths that correspond to
         submodule entries in .gitmodules are omitted.
         """
-        result = self.git("status", "--porcelain", check=False)
+        # Read-only: don't let status refresh (and lock) the index.
+        result = self.git("--no-optional-locks", "status", "--porcelain", check=False)
         if result.returncode != 0:
             return []
         lines = []
@@ -262,16 +305,20 @@ class RepoInfo:
         Returns tuple of (ahead, behind) as strings.
         Returns ('new-branch', '0') if remote branch doesn't exist.
         """
+        # Common case: an upstream is configured and one rev-list answers.
+        # It fails without an upstream, so only then is rev-parse needed to
+        # tell "no upstream" apart from other errors.
+        count_result = self.git(
+            "rev-list", "--count", "--left-right", "@{upstream}...HEAD", check=False
+        )
+        if count_result.returncode == 0:
+            parts = count_result.stdout.strip().split()
+            if len(parts) == 2:
+                return (parts[1], parts[0])  # ahead, behind
+
         # Check if upstream is configured
         result = self.git("rev-parse", "--abbrev-ref", "@{upstream}", check=False)
         if result.returncode == 0:
-            count_result = self.git(
-                "rev-list", "--count", "--left-right", "@{upstream}...HEAD", check=False
-            )
-            if count_result.returncode == 0:
-                parts = count_result.stdout.strip().split()
-                if len(parts) == 2:
-                    return (parts[1], parts[0])  # ahead, behind
             return ("0", "0")
 
         # No upstream - check if remote branch exists
@@ -292,6 +339,16 @@ class RepoInfo:
 
         return ("new-branch", "0")
 
+    def reset_validation(self) -> None:
+        """Clear the results of a previous validate() so it can run again.
+
+        Remote-tracking refs are untouched; validate() never fetches.
+        """
+        self.ahead_count = None
+        self.behind_count = None
+        self.status = RepoStatus.OK
+        self.error_message = None
+
     def validate(
         self,
         check_sync: bool = False,
@@ -358,29 +415,38 @@ class RepoInfo:
 
         return True
 
-    def push(self, dry_run: bool = False) -> bool:
-        """Push repository to remote. Returns True on success."""
+    def describe_push(self) -> str:
+        """Return the status line announcing a push of this repository."""
+        if self.ahead_count == "new-branch":
+            return f"  {Colors.blue('Pushing')} {self.rel_path} {Colors.yellow(f'(new branch: {self.branch})')}"
+        return f"  {Colors.blue('Pushing')} {self.rel_path} {Colors.green(f'({self.ahead_count} commits on {self.branch})')}"
+
+    def push(self, dry_run: bool = False, quiet: bool = False) -> bool:
+        """Push repository to remote. Returns True on success.
+
+        Args:
+            dry_run: Preview only.
+            quiet: Skip the status line and capture git's output instead of
+                streaming it (for callers pushing several repos at once).
+                On failure git's error output is kept in ``error_message``.
+        """
         if self.branch is None:
             raise RuntimeError("Cannot push without a branch (call validate() first)")
 
-        if self.ahead_count == "new-branch":
-            print(
-                f"  {Colors.blue('Pushing')} {self.rel_path} {Colors.yellow(f'(new branch: {self.branch})')}"
-            )
-        else:
-            print(
-                f"  {Colors.blue('Pushing')} {self.rel_path} {Colors.green(f'({self.ahead_count} commits on {self.branch})')}"
-            )
+        if not quiet:
+            print(self.describe_push())
 
         if dry_run:
             return True
 
         # Try regular push first, then with -u if needed
-        result = self.git("push", check=False, capture=False)
+        result = self.git("push", check=False, capture=quiet)
         if result.returncode != 0:
             result = self.git(
-                "push", "-u", "origin", self.branch, check=False, capture=False
+                "push", "-u", "origin", self.branch, check=False, capture=quiet
             )
+            if result.returncode != 0 and quiet:
+                self.error_message = result.stderr.strip() or "git push failed"
 
         return result.returncode == 0
 
@@ -393,7 +459,8 @@ class RepoInfo:
         """
         args = ["fetch"]
         if all_remotes:
-            args.append("--all")
+            # Fetch the remotes in parallel rather than one after another.
+            args.extend(["--all", f"--jobs={FETCH_JOBS}"])
         result = self.git(*args, check=False, capture=True)
         return result.returncode == 0
 
@@ -410,30 +477,39 @@ class RepoInfo:
             return (True, "")
         return (False, result.stderr.strip())
 
+    def get_branches(self) -> tuple[list[str], list[str]]:
+        """Get ``(local, remote)`` branch names from a single ``for-each-ref``.
+
+        Remote names drop the ``origin/`` prefix; other remotes keep theirs.
+        Symbolic ``<remote>/HEAD`` refs are skipped.
+        """
+        result = self.git(
+            "for-each-ref",
+            "--format=%(refname)",
+            "refs/heads",
+            "refs/remotes",
+            check=False,
+        )
+        if result.returncode != 0:
+            return ([], [])
+        local: list[str] = []
+        remote: list[str] = []
+        for line in result.stdout.splitlines():
+            if line.startswith("refs/heads/"):
+                local.append(line[len("refs/heads/") :])
+            elif line.startswith("refs/remotes/") and not line.endswith("/HEAD"):
+                name = line[len("refs/remotes/") :]
+                # Remove 'origin/' prefix
+                remote.append(name[7:] if name.startswith("origin/") else name)
+        return (local, remote)
+
     def get_local_branches(self) -> list[str]:
         """Get list of local branch names."""
-        result = self.git("branch", "--format=%(refname:short)", check=False)
-        if result.returncode != 0:
-            return []
-        return [
-            line.strip() for line in result.stdout.strip().split("\n") if line.strip()
-        ]
+        return self.get_branches()[0]
 
     def get_remote_branches(self) -> list[str]:
         """Get list of remote tracking branch names (without 'origin/' prefix)."""
-        result = self.git("branch", "-r", "--format=%(refname:short)", check=False)
-        if result.returncode != 0:
-            return []
-        branches = []
-        for line in result.stdout.strip().split("\n"):
-            line = line.strip()
-            if line and not line.endswith("/HEAD"):
-                # Remove 'origin/' prefix
-                if line.startswith("origin/"):
-                    branches.append(line[7:])
-                else:
-                    branches.append(line)
-        return branches
+        return self.get_branches()[1]
 
     def get_commit_sha(self, short: bool = True) -> str:
         """
@@ -565,6 +641,26 @@ def topological_sort_repos(repos: list[RepoInfo]) -> list[RepoInfo]:
     return [path_to_repo[path] for path in sorted_paths]
 
 
+def topological_levels(repos: list[RepoInfo]) -> list[list[RepoInfo]]:
+    """Group repositories into bottom-up levels.
+
+    Every repo in a level depends only on repos in earlier levels, so the
+    members of one level can be processed concurrently.
+    """
+    graph = build_dependency_graph(repos)
+    path_to_repo = {repo.path: repo for repo in repos}
+
+    sorter = TopologicalSorter(graph)
+    sorter.prepare()
+    levels: list[list[RepoInfo]] = []
+    while sorter.is_active():
+        ready = sorted(sorter.get_ready())
+        levels.append([path_to_repo[path] for path in ready])
+        sorter.done(*ready)
+
+    return levels
+
+
 def print_status_table(repos: list[RepoInfo], show_behind: bool = False) -> None:
     """Print a formatted status table."""
     print(f"\n{Colors.blue('Repository Status:')}")
@@ -14,6 +14,7 @@ Usage (via entry point):
     grove sync --dry-run              # Preview changes
     grove sync --no-push              # Commit only, skip pushing
     grove sync --skip-checks                # Skip remote sync validation
+    grove sync --full-fetch           # Fetch tags as well
 
 This module:
 1. Discovers all matching submodule locations for each sync group
@@ -26,8 +27,12 @@ This module:
 
 from __future__ import annotations
 
+import functools
+import importlib
+import os
 import re
 import subprocess
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -37,14 +42,37 @@ from grove.repo_utils import (
     RepoInfo,
     RepoStatus,
     find_repo_root,
+    map_concurrently,
     parse_gitmodules,
     print_status_table,
     run_git,
-    topological_sort_repos,
+    topological_levels,
+)
+
+# Abbreviated or full commit SHA, as accepted for ``--commit``.
+_SHA_RE = re.compile(r"^[a-f0-9]{7,40}$")
+
+# Sync only needs commits, so tags are skipped unless --full-fetch is given.
+# No ``--filter`` is passed: it would turn an ordinary clone into a partial
+# clone for good, and repos that already are partial clones apply their
+# configured ``remote.<name>.partialclonefilter`` on every fetch anyway.
+_LIGHT_FETCH_ARGS = ("--no-tags",)
+
+# Directories never searched for nested ``.gitmodules`` files: git metadata
+# plus dependency and cache trees that are not part of the submodule layout.
+_PRUNE_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "venv",
+        ".venv",
+        "__pycache__",
+        ".cache",
+    }
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncSubmodule:
     """Information about a sync-group submodule location."""
 
@@ -52,6 +80,7 @@ class SyncSubmodule:
     parent_repo: Path
     submodule_rel_path: str  # Path relative to parent repo
     current_commit: str | None = None
+    rel_path: str = ""  # Path relative to the project root
 
     def git(
         self, *args: str, check: bool = True, capture: bool = True
@@ -61,14 +90,26 @@ class SyncSubmodule:
 
     def get_current_commit(self) -> str | None:
         """Get current HEAD commit."""
+        pygit2 = _load_pygit2()
+        if pygit2 is not None:
+            try:
+                return str(pygit2.Repository(str(self.path)).head.target)
+            except (pygit2.GitError, KeyError):
+                pass  # let the git CLI handle anything libgit2 can't read
         result = self.git("rev-parse", "HEAD", check=False)
         return result.stdout.strip() if result.returncode == 0 else None
 
+    def has_commit(self, commit: str) -> bool:
+        """Return True if *commit* is already in this submodule's object store."""
+        result = self.git("cat-file", "-e", f"{commit}^{{commit}}", check=False)
+        return result.returncode == 0
+
     def update_to_commit(
         self,
         commit: str,
         dry_run: bool = False,
         source_path: Path | None = None,
+        full_fetch: bool = False,
     ) -> bool:
         """Update submodule to target commit.
 
@@ -77,22 +118,58 @@ class SyncSubmodule:
             dry_run: Preview only.
             source_path: Path to a local repo that has the commit.
                 When set, fetches from that path instead of all remotes.
+            full_fetch: Fetch tags from remotes too.
         """
         if dry_run:
             return True
 
-        if source_path:
-            self.git("fetch", str(source_path), check=False)
-        else:
-            self.git("fetch", "--all", "--quiet", check=False)
+        # Instances of the same repo often already have the target (e.g. it
+        # was the local tip), so only fetch when the object is missing.
+        if not self.has_commit(commit):
+            if source_path:
+                self.git("fetch", str(source_path), check=False)
+            else:
+                # No --jobs: instances are already updated concurrently, so
+                # remotes are fetched one after another within each.
+                _fetch(self, "--all", "--quiet", full=full_fetch)
 
         result = self.git("checkout", commit, "--quiet", check=False)
         return result.returncode == 0
 
 
-def resolve_remote_url(repo_root: Path, url_match: str) -> str | None:
-    """Return the first matching remote URL from any nested ``.gitmodules`` file."""
-    for gitmodules_path in _iter_gitmodules_paths(repo_root):
+@functools.cache
+def _load_pygit2():
+    """Return the optional ``pygit2`` module, or None when not installed.
+
+    Reading HEAD through libgit2 avoids spawning ``git rev-parse`` per
+    submodule.  Install with ``pip install grove[git]``.
+    """
+    try:
+        return importlib.import_module("pygit2")
+    except ImportError:
+        return None
+
+
+def _fetch(
+    target: SyncSubmodule | RepoInfo, *args: str, full: bool = False
+) -> subprocess.CompletedProcess:
+    """Run ``git fetch`` in *target*, skipping tags unless *full*."""
+    extra = () if full else _LIGHT_FETCH_ARGS
+    return target.git("fetch", *args, *extra, check=False)
+
+
+def resolve_remote_url(
+    repo_root: Path,
+    url_match: str,
+    gitmodules_paths: list[Path] | None = None,
+) -> str | None:
+    """Return the first matching remote URL from any nested ``.gitmodules`` file.
+
+    *gitmodules_paths* may be passed to reuse an earlier tree walk.
+    """
+    if gitmodules_paths is None:
+        gitmodules_paths = list(_iter_gitmodules_paths(repo_root))
+    for gitmodules_path in gitmodules_paths:
         entries = parse_gitmodules(gitmodules_path, url_match=url_match)
         if entries:
             _name, _path, url = entries[0]
@@ -100,35 +177,120 @@ def resolve_remote_url(repo_root: Path, url_match: str) -> str | None:
     return None
 
 
+def _walk_gitmodules(root: Path, skip: frozenset[str] = _PRUNE_DIRS):
+    """Yield ``.gitmodules`` files beneath *root*, pruning *skip* directories.
+
+    Unlike ``Path.rglob`` this never descends into ``.git`` or dependency
+    directories, so their contents are not stat'ed at all.  Symlinked
+    directories are not followed.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name in skip:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.name == ".gitmodules" and entry.is_file(follow_symlinks=False):
+                yield Path(entry.path)
+
+
 def _iter_gitmodules_paths(repo_root: Path):
     """Yield ``.gitmodules`` paths beneath *repo_root* in stable order."""
-    repo_root = repo_root.resolve()
-    for gitmodules_path in sorted(repo_root.rglob(".gitmodules")):
-        if "node_modules" in gitmodules_path.parts:
-            continue
-        yield gitmodules_path
+    yield from sorted(_walk_gitmodules(repo_root.resolve()))
+
+
+def _read_submodule_commits(parent_repo: Path, subpaths: list[str]) -> dict[str, str]:
+    """Map submodule paths in *parent_repo* to their checked-out HEAD commits.
+
+    One ``git ls-files --stage`` reads the gitlinks recorded in the index and
+    one ``git diff --name-only`` lists submodules whose HEAD has moved away
+    from them.  Paths that moved (or could not be read) are left out so the
+    caller can fall back to a per-submodule ``rev-parse``.
+
+    ``git submodule status`` is avoided on purpose: it spawns ``git describe``
+    for every submodule it prints.
+    """
+    if not subpaths:
+        return {}
+
+    staged = run_git(parent_repo, "ls-files", "--stage", "--", *subpaths, check=False)
+    if staged.returncode != 0:
+        return {}
+
+    commits: dict[str, str] = {}
+    for line in staged.stdout.splitlines():
+        # Format: "<mode> <sha> <stage>\t<path>"
+        meta, _, path = line.partition("\t")
+        parts = meta.split()
+        if len(parts) == 3 and parts[0] == "160000":
+            commits[path] = parts[1]
+
+    moved = run_git(
+        parent_repo,
+        "diff",
+        "--name-only",
+        "--ignore-submodules=dirty",
+        "--",
+        *subpaths,
+        check=False,
+    )
+    if moved.returncode != 0:
+        return {}
+    for path in moved.stdout.splitlines():
+        commits.pop(path, None)
+
+    return commits
+
 
+def discover_sync_submodules(
+    repo_root: Path,
+    url_match: str,
+    gitmodules_paths: list[Path] | None = None,
+) -> list[SyncSubmodule]:
+    """Discover all submodule locations matching *url_match* by parsing .gitmodules files.
 
-def discover_sync_submodules(repo_root: Path, url_match: str) -> list[SyncSubmodule]:
-    """Discover all submodule locations matching *url_match* by parsing .gitmodules files."""
+    Pass *gitmodules_paths* (from ``_iter_gitmodules_paths``) to reuse one
+    tree walk across several sync groups.
+    """
     submodules = []
+    root = repo_root.resolve()
+    if gitmodules_paths is None:
+        gitmodules_paths = list(_iter_gitmodules_paths(repo_root))
 
-    for gitmodules_path in _iter_gitmodules_paths(repo_root):
+    for gitmodules_path in gitmodules_paths:
         parent_repo = gitmodules_path.parent
         entries = parse_gitmodules(gitmodules_path, url_match=url_match)
 
+        found: list[SyncSubmodule] = []
         for _name, submodule_path, _url in entries:
             full_path = parent_repo / submodule_path
 
             if not (full_path / ".git").exists():
                 continue
 
-            submodule = SyncSubmodule(
-                path=full_path,
-                parent_repo=parent_repo,
-                submodule_rel_path=submodule_path,
+            found.append(
+                SyncSubmodule(
+                    path=full_path,
+                    parent_repo=parent_repo,
+                    submodule_rel_path=submodule_path,
+                    rel_path=str(full_path.relative_to(root)),
+                )
             )
-            submodule.current_commit = submodule.get_current_commit()
+
+        commits = _read_submodule_commits(
+            parent_repo, [s.submodule_rel_path for s in found]
+        )
+        for submodule in found:
+            submodule.current_commit = commits.get(submodule.submodule_rel_path)
+            if submodule.current_commit is None:
+                submodule.current_commit = submodule.get_current_commit()
             submodules.append(submodule)
 
     return submodules
@@ -155,6 +317,8 @@ def get_parent_repos_for_submodules(
     path_to_repo = {r.path: r for r in all_repos}
     collected: dict[Path, RepoInfo] = {}
 
+    # Climb parent pointers (no filesystem probes) and stop at the first
+    # ancestor already collected, so shared ancestry is visited only once.
     for submodule in submodules:
         repo = path_to_repo.get(submodule.parent_repo)
         while repo is not None and repo.path not in collected:
@@ -194,7 +358,7 @@ def resolve_target_commit(
         Tuple of (full_sha, source_description)
     """
     if commit_arg:
-        if not re.match(r"^[a-f0-9]{7,40}$", commit_arg):
+        if not _SHA_RE.match(commit_arg):
             raise ValueError(f"Invalid commit SHA: {commit_arg}")
         return (commit_arg, "CLI argument")
 
@@ -205,59 +369,82 @@ def resolve_target_commit(
                 f"Standalone repo not found at {standalone_repo}\n"
                 "Please specify a commit SHA explicitly."
             )
+        return _resolve_standalone_commit(standalone_repo)
 
-        result = run_git(standalone_repo, "remote", "get-url", "origin", check=False)
+    # --- git ls-remote fallback ---
+    if remote_url is not None:
+        return (_ls_remote_head(remote_url), f"HEAD from {remote_url}")
 
-        if result.returncode == 0:
-            run_git(standalone_repo, "fetch", "origin", "main", "--quiet", check=False)
-            result = run_git(standalone_repo, "rev-parse", "origin/main", check=False)
-            if result.returncode == 0:
-                return (result.stdout.strip(), f"origin/main from {standalone_repo}")
+    raise ValueError(
+        "Cannot resolve target commit: no standalone-repo configured and no remote URL found.\n"
+        "Please specify a commit SHA explicitly."
+    )
 
-            result = run_git(standalone_repo, "rev-parse", "origin/HEAD", check=False)
-            if result.returncode == 0:
-                return (result.stdout.strip(), f"origin/HEAD from {standalone_repo}")
 
-        # Fallback to local main
-        result = run_git(standalone_repo, "rev-parse", "main", check=False)
+@functools.cache
+def _resolve_standalone_commit(standalone_repo: Path) -> tuple[str, str]:
+    """Resolve the target commit from a local standalone clone.
+
+    Memoized per process so groups sharing a standalone repo fetch it once.
+    Failures raise and are therefore never cached.
+    """
+    result = run_git(standalone_repo, "remote", "get-url", "origin", check=False)
+
+    if result.returncode == 0:
+        run_git(standalone_repo, "fetch", "origin", "main", "--quiet", check=False)
+        result = run_git(standalone_repo, "rev-parse", "origin/main", check=False)
         if result.returncode == 0:
-            return (result.stdout.strip(), f"main from {standalone_repo}")
+            return (result.stdout.strip(), f"origin/main from {standalone_repo}")
 
-        result = run_git(standalone_repo, "rev-parse", "HEAD", check=False)
+        result = run_git(standalone_repo, "rev-parse", "origin/HEAD", check=False)
         if result.returncode == 0:
-            return (result.stdout.strip(), f"HEAD from {standalone_repo}")
+            return (result.stdout.strip(), f"origin/HEAD from {standalone_repo}")
 
-        raise ValueError(f"Could not resolve commit from {standalone_repo}")
+    # Fallback to local main
+    result = run_git(standalone_repo, "rev-parse", "main", check=False)
+    if result.returncode == 0:
+        return (result.stdout.strip(), f"main from {standalone_repo}")
 
-    # --- git ls-remote fallback ---
-    if remote_url is not None:
-        result = subprocess.run(
-            ["git", "ls-remote", remote_url, "HEAD"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            raise ValueError(
-                f"git ls-remote failed for {remote_url}\n"
-                "Check network connectivity or specify a commit SHA explicitly."
-            )
-        line = result.stdout.strip()
-        if not line:
-            raise ValueError(
-                f"No HEAD found at {remote_url}\nSpecify a commit SHA explicitly."
-            )
-        sha = line.split()[0]
-        return (sha, f"HEAD from {remote_url}")
+    result = run_git(standalone_repo, "rev-parse", "HEAD", check=False)
+    if result.returncode == 0:
+        return (result.stdout.strip(), f"HEAD from {standalone_repo}")
 
-    raise ValueError(
-        "Cannot resolve target commit: no standalone-repo configured and no remote URL found.\n"
-        "Please specify a commit SHA explicitly."
+    raise ValueError(f"Could not resolve commit from {standalone_repo}")
+
+
+@functools.cache
+def _ls_remote_head(remote_url: str) -> str:
+    """Return the HEAD commit advertised by *remote_url*.
+
+    Memoized per process so groups sharing an upstream only pay for one
+    network round trip.  Failures raise and are therefore never cached.
+    """
+    result = subprocess.run(
+        ["git", "ls-remote", remote_url, "HEAD"],
+        capture_output=True,
+        text=True,
     )
+    if result.returncode != 0:
+        raise ValueError(
+            f"git ls-remote failed for {remote_url}\n"
+            "Check network connectivity or specify a commit SHA explicitly."
+        )
+    line = result.stdout.strip()
+    if not line:
+        raise ValueError(
+            f"No HEAD found at {remote_url}\nSpecify a commit SHA explicitly."
+        )
+    return line.split()[0]
+
+
+def _clear_target_caches() -> None:
+    """Forget memoized remote targets (e.g. after pushing to those remotes)."""
+    _resolve_standalone_commit.cache_clear()
+    _ls_remote_head.cache_clear()
 
 
 def resolve_local_tip(
     submodules: list[SyncSubmodule],
-    repo_root: Path,
 ) -> tuple[str, Path, str] | None:
     """Find the most advanced commit among local submodule instances.
 
@@ -266,67 +453,33 @@ def resolve_local_tip(
     """
     commits: dict[str, SyncSubmodule] = {}
     for sub in submodules:
-        if sub.current_commit and sub.current_commit not in commits:
-            commits[sub.current_commit] = sub
+        if sub.current_commit:
+            commits.setdefault(sub.current_commit, sub)
 
     if not commits:
         return None
 
     if len(commits) == 1:
         sha, sub = next(iter(commits.items()))
-        rel = str(sub.path.relative_to(repo_root))
-        return (sha, sub.path, f"local tip from {rel}")
-
-    # Find the tip: the commit that is a descendant of all others.
-    items = list(commits.items())
-    tip_sha, tip_sub = items[0]
-
-    for sha, sub in items[1:]:
-        # Is current tip an ancestor of sha?  Then sha is more advanced.
-        result = run_git(
-            sub.path,
-            "merge-base",
-            "--is-ancestor",
-            tip_sha,
-            sha,
-            check=False,
-        )
-        if result.returncode == 0:
-            tip_sha, tip_sub = sha, sub
-            continue
-
-        # Is sha an ancestor of current tip?  Then tip stays.
-        result = run_git(
-            tip_sub.path,
-            "merge-base",
-            "--is-ancestor",
-            sha,
-            tip_sha,
-            check=False,
-        )
-        if result.returncode == 0:
-            continue
-
-        # Diverged — no linear ordering.
-        return None
-
-    # Verify tip is actually a descendant of every commit (handles non-transitive edge cases).
-    for sha in commits:
-        if sha == tip_sha:
-            continue
-        result = run_git(
-            tip_sub.path,
-            "merge-base",
-            "--is-ancestor",
-            sha,
-            tip_sha,
-            check=False,
-        )
+        return (sha, sub.path, f"local tip from {sub.rel_path}")
+
+    # ``merge-base --independent`` reduces the commits to those not reachable
+    # from any other: exactly one means a linear history with that tip.  It
+    # needs every commit in one object store, which the tip's own instance
+    # has whenever the history is linear, so try instances until one can
+    # answer.  One git call per instance at worst, instead of one per pair.
+    for sub in commits.values():
+        result = run_git(sub.path, "merge-base", "--independent", *commits, check=False)
         if result.returncode != 0:
-            return None
-
-    rel = str(tip_sub.path.relative_to(repo_root))
-    return (tip_sha, tip_sub.path, f"local tip from {rel}")
+            continue  # this instance is missing some of the commits
+        tips = result.stdout.split()
+        if len(tips) != 1 or tips[0] not in commits:
+            return None  # diverged — no linear ordering
+        tip_sub = commits[tips[0]]
+        return (tips[0], tip_sub.path, f"local tip from {tip_sub.rel_path}")
+
+    # No instance holds all commits, so none of them descends from the rest.
+    return None
 
 
 def commit_submodule_changes(
@@ -334,40 +487,77 @@ def commit_submodule_changes(
     submodule_paths: list[str],
     message: str,
     dry_run: bool = False,
+    check_changes: bool = True,
 ) -> bool:
     """
     Commit submodule changes in a parent repo.
     Returns True if a commit was made.
-    """
-    has_changes = False
-    for subpath in submodule_paths:
-        result = parent_repo.git("diff", "--quiet", subpath, check=False)
-        if result.returncode != 0:
-            has_changes = True
-            break
 
-    if not has_changes:
+    Pass ``check_changes=False`` when the caller already knows the paths
+    have unstaged changes, to skip the initial ``git diff``.
+
+    Raises:
+        RuntimeError: If ``git add`` or ``git commit`` fails.  A single bad
+            path makes git reject the whole batched add.
+    """
+    if not submodule_paths:
         return False
 
+    # One diff/add over every path instead of one subprocess per submodule.
+    if check_changes:
+        result = parent_repo.git("diff", "--quiet", "--", *submodule_paths, check=False)
+        if result.returncode == 0:
+            return False
+
     if dry_run:
         print(f"  {Colors.yellow('Would commit')} in {parent_repo.rel_path}: {message}")
         return True
 
-    for subpath in submodule_paths:
-        parent_repo.git("add", subpath, check=False)
+    result = parent_repo.git("add", "--", *submodule_paths, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"git add failed in {parent_repo.rel_path}: {result.stderr.strip()}"
+        )
 
-    result = parent_repo.git("diff", "--cached", "--quiet", check=False)
+    result = parent_repo.git(
+        "diff", "--cached", "--quiet", "--", *submodule_paths, check=False
+    )
     if result.returncode == 0:
         return False
 
-    parent_repo.git("commit", "-m", message, check=False)
+    result = parent_repo.git("commit", "-m", message, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"git commit failed in {parent_repo.rel_path}: "
+            f"{(result.stderr or result.stdout).strip()}"
+        )
     print(f"  {Colors.green('Committed')} in {parent_repo.rel_path}: {message}")
     return True
 
 
+def _ahead_of_origin(
+    submodule: SyncSubmodule, full_fetch: bool = False
+) -> tuple[str, str] | None:
+    """Return ``(branch, ahead_count)`` if *submodule* has unpushed commits."""
+    branch = submodule.git("branch", "--show-current", check=False).stdout.strip()
+    if not branch:
+        return None
+
+    _fetch(submodule, "origin", "--quiet", full=full_fetch)
+
+    result = submodule.git("rev-list", "--count", f"origin/{branch}..HEAD", check=False)
+    if result.returncode != 0:
+        return None
+    ahead_count = result.stdout.strip()
+    if not ahead_count or ahead_count == "0":
+        return None
+    return branch, ahead_count
+
+
 def push_ahead_submodules(
     submodules: list[SyncSubmodule],
     dry_run: bool = False,
+    full_fetch: bool = False,
 ) -> bool:
     """
     Push any sync-group submodules that are ahead of their remotes.
@@ -379,45 +569,32 @@ def push_ahead_submodules(
     """
     pushed_any = False
 
-    for submodule in submodules:
-        branch_result = submodule.git("branch", "--show-current", check=False)
-        branch = branch_result.stdout.strip()
-        if not branch:
-            continue
-
-        submodule.git("fetch", "origin", "--quiet", check=False)
+    # The fetch + ahead check is network-bound and independent per instance;
+    # the pushes themselves stay sequential since instances may share a branch.
+    ahead = map_concurrently(lambda s: _ahead_of_origin(s, full_fetch), submodules)
 
-        ahead_result = submodule.git(
-            "rev-list", "--count", f"origin/{branch}..HEAD", check=False
-        )
-        if ahead_result.returncode != 0:
+    for submodule, found in zip(submodules, ahead):
+        if found is None:
             continue
-
-        ahead_count = ahead_result.stdout.strip()
-        if ahead_count and ahead_count != "0":
-            rel_path = submodule.submodule_rel_path
-            if dry_run:
-                print(
-                    f"  {Colors.yellow('Would push')} {rel_path} ({ahead_count} commits ahead)"
-                )
+        branch, ahead_count = found
+        rel_path = submodule.submodule_rel_path
+        if dry_run:
+            print(
+                f"  {Colors.yellow('Would push')} {rel_path} ({ahead_count} commits ahead)"
+            )
+        else:
+            result = submodule.git("push", "origin", branch, check=False, capture=False)
+            if result.returncode == 0:
+                print(f"  {Colors.green('Pushed')} {rel_path} ({ahead_count} commits)")
+                pushed_any = True
             else:
-                result = submodule.git(
-                    "push", "origin", branch, check=False, capture=False
-                )
-                if result.returncode == 0:
-                    print(
-                        f"  {Colors.green('Pushed')} {rel_path} ({ahead_count} commits)"
-                    )
-                    pushed_any = True
-                else:
-                    print(f"  {Colors.red('Failed to push')} {rel_path}")
+                print(f"  {Colors.red('Failed to push')} {rel_path}")
 
     return pushed_any
 
 
 def _display_group_discovery(
     quiet: bool,
-    repo_root: Path,
     target_commit: str,
     all_submodules: list[SyncSubmodule],
     allow_drift: set[str],
@@ -425,22 +602,29 @@ def _display_group_discovery(
     if quiet:
         return
 
-    print(f"Found {Colors.green(str(len(all_submodules)))} submodule locations:")
+    # Build the listing first and write it once: stdout is line-buffered on a
+    # terminal, so one print() per submodule means one write() per line.
+    lines = [f"Found {Colors.green(str(len(all_submodules)))} submodule locations:"]
     target_short = target_commit[:7]
+    # Colour the glyphs once per listing rather than once per submodule.
+    drift_mark = f"  {Colors.yellow('~')} "
+    drift_tag = Colors.yellow("(allow-drift, skipped)")
+    done_mark = f"  {Colors.green('✓')} "
+    todo_mark = f"  {Colors.yellow('→')} "
     for submodule in all_submodules:
-        rel_path = str(submodule.path.relative_to(repo_root))
+        rel_path = submodule.rel_path
         current = (
             submodule.current_commit[:7] if submodule.current_commit else "unknown"
         )
         if rel_path in allow_drift:
-            print(
-                f"  {Colors.yellow('~')} {rel_path} ({current}) {Colors.yellow('(allow-drift, skipped)')}"
-            )
-        elif current == target_short:
-            print(f"  {Colors.green('✓')} {rel_path} (already at {current})")
+            lines.append(f"{drift_mark}{rel_path} ({current}) {drift_tag}")
+        elif submodule.current_commit and submodule.current_commit.startswith(
+            target_commit
+        ):
+            lines.append(f"{done_mark}{rel_path} (already at {current})")
         else:
-            print(f"  {Colors.yellow('→')} {rel_path} ({current} → {target_short})")
-    print()
+            lines.append(f"{todo_mark}{rel_path} ({current} → {target_short})")
+    print("\n".join(lines), end="\n\n")
 
 
 def _resolve_group_target(
@@ -453,6 +637,8 @@ def _resolve_group_target(
     force: bool,
     quiet: bool,
     source_path: Path | None,
+    full_fetch: bool = False,
+    gitmodules_paths: list[Path] | None = None,
 ) -> tuple[str, str, Path | None]:
     if commit_arg:
         if not quiet:
@@ -463,12 +649,15 @@ def _resolve_group_target(
     if remote:
         if not quiet:
             print(Colors.blue("Checking for ahead submodules..."))
-        if push_ahead_submodules(submodules, dry_run) and not quiet:
-            print()
+        if push_ahead_submodules(submodules, dry_run, full_fetch):
+            # The remotes just moved; don't reuse a target resolved earlier.
+            _clear_target_caches()
+            if not quiet:
+                print()
 
         if not quiet:
             print(Colors.blue("Resolving target commit from remote..."))
-        remote_url = resolve_remote_url(repo_root, group.url_match)
+        remote_url = resolve_remote_url(repo_root, group.url_match, gitmodules_paths)
         target_commit, commit_source = resolve_target_commit(
             None,
             group.standalone_repo,
@@ -478,7 +667,7 @@ def _resolve_group_target(
 
     if not quiet:
         print(Colors.blue("Resolving target commit from local instances..."))
-    tip = resolve_local_tip(submodules, repo_root)
+    tip = resolve_local_tip(submodules)
     if tip is not None:
         target_commit, tip_source_path, commit_source = tip
         return target_commit, commit_source, tip_source_path
@@ -504,18 +693,64 @@ def _submodules_needing_update(
     submodules: list[SyncSubmodule],
     target_commit: str,
 ) -> list[SyncSubmodule]:
+    # ``target_commit`` is a full SHA unless given abbreviated on the CLI, so
+    # a prefix test is exact equality in the common case and still matches
+    # the commit an abbreviated argument names.
     return [
         s
         for s in submodules
-        if not s.current_commit or s.current_commit[:7] != target_commit[:7]
+        if not s.current_commit or not s.current_commit.startswith(target_commit)
     ]
 
 
+def _fetch_parent_repos(parent_repos: list[RepoInfo], full_fetch: bool) -> None:
+    """Fetch every parent repo, going to the network once per remote URL.
+
+    Parents that share an origin (e.g. instances of an intermediate sync
+    group) copy the remote-tracking refs from the one that fetched, which
+    is a local transfer.  Any repo whose copy fails fetches normally.
+    """
+    urls = map_concurrently(lambda repo: repo.get_remote_url(), parent_repos)
+    leaders: dict[str, RepoInfo] = {}
+    fetch_first: list[RepoInfo] = []
+    followers: list[tuple[RepoInfo, str]] = []
+    for repo, url in zip(parent_repos, urls):
+        if url is not None and url in leaders:
+            followers.append((repo, url))
+            continue
+        if url is not None:
+            leaders[url] = repo
+        fetch_first.append(repo)
+
+    results = map_concurrently(
+        lambda repo: _fetch(repo, "--quiet", full=full_fetch), fetch_first
+    )
+    fetched = {repo.path for repo, r in zip(fetch_first, results) if r.returncode == 0}
+
+    def follow(pair: tuple[RepoInfo, str]) -> None:
+        repo, url = pair
+        leader = leaders[url]
+        if leader.path in fetched:
+            result = repo.git(
+                "fetch",
+                "--quiet",
+                str(leader.path),
+                "+refs/remotes/origin/*:refs/remotes/origin/*",
+                check=False,
+            )
+            if result.returncode == 0:
+                return
+        _fetch(repo, "--quiet", full=full_fetch)
+
+    map_concurrently(follow, followers)
+
+
 def _validate_parent_repositories(
     submodules: list[SyncSubmodule],
     repo_root: Path,
     quiet: bool,
     force: bool,
+    full_fetch: bool = False,
 ) -> tuple[int, list[RepoInfo]]:
     if not quiet:
         print(Colors.blue("Validating parent repositories..."))
@@ -523,8 +758,7 @@ def _validate_parent_repositories(
 
     if not quiet:
         print("  Fetching from remotes...")
-    for repo in parent_repos:
-        repo.git("fetch", "--quiet", check=False)
+    _fetch_parent_repos(parent_repos, full_fetch)
 
     validation_failed = False
     for repo in parent_repos:
@@ -564,34 +798,59 @@ def _validate_parent_repositories(
 
 def _update_group_submodules(
     submodules_to_update: list[SyncSubmodule],
-    repo_root: Path,
     group_name: str,
     target_commit: str,
     dry_run: bool,
     quiet: bool,
     source_path: Path | None,
+    full_fetch: bool = False,
 ) -> list[SyncSubmodule]:
     if not quiet:
         print(Colors.blue(f"Updating {group_name} submodules..."))
-    updated_submodules: list[SyncSubmodule] = []
 
-    for submodule in submodules_to_update:
-        rel_path = str(submodule.path.relative_to(repo_root))
-        if dry_run:
-            if not quiet:
-                print(f"  {Colors.yellow('Would update')} {rel_path}")
-            updated_submodules.append(submodule)
-            continue
+    if not submodules_to_update:
+        return []
+
+    if dry_run:
+        if not quiet:
+            would = Colors.yellow("Would update")
+            print(
+                "\n".join(f"  {would} {s.rel_path}" for s in submodules_to_update),
+                end="\n\n",
+            )
+        return list(submodules_to_update)
+
+    def update(submodule: SyncSubmodule, peer_path: Path | None) -> bool:
+        if source_path is None and peer_path is not None:
+            if submodule.update_to_commit(target_commit, source_path=peer_path):
+                return True
+        return submodule.update_to_commit(
+            target_commit, source_path=source_path, full_fetch=full_fetch
+        )
 
-        if submodule.update_to_commit(target_commit, source_path=source_path):
+    # Every instance tracks the same upstream, so update one instance first
+    # and let the rest fetch the target from that local clone, concurrently,
+    # instead of each going to the network.
+    first, rest = submodules_to_update[0], submodules_to_update[1:]
+    first_ok = update(first, None)
+    peer_path = first.path if first_ok else None
+    results = [first_ok] + map_concurrently(lambda s: update(s, peer_path), rest)
+
+    # Report once all instances are done, as a single write.
+    updated_submodules: list[SyncSubmodule] = []
+    lines: list[str] = []
+    for submodule, updated in zip(submodules_to_update, results):
+        if updated:
             if not quiet:
-                print(f"  {Colors.green('Updated')} {rel_path}")
+                lines.append(f"  {Colors.green('Updated')} {submodule.rel_path}")
             updated_submodules.append(submodule)
         else:
-            print(f"  {Colors.red('Failed to update')} {rel_path}")
+            lines.append(f"  {Colors.red('Failed to update')} {submodule.rel_path}")
 
     if not quiet:
-        print()
+        lines.append("")
+    if lines:
+        print("\n".join(lines))
     return updated_submodules
 
 
@@ -605,24 +864,29 @@ def _commit_group_updates(
     if not quiet:
         print(Colors.blue("Committing changes bottom-up..."))
 
-    parent_to_subpaths: dict[Path, list[str]] = {}
+    parent_to_subpaths: defaultdict[Path, list[str]] = defaultdict(list)
     for submodule in updated_submodules:
-        parent_to_subpaths.setdefault(submodule.parent_repo, []).append(
-            submodule.submodule_rel_path
-        )
+        parent_to_subpaths[submodule.parent_repo].append(submodule.submodule_rel_path)
 
     committed_repos: list[RepoInfo] = []
     for repo in parent_repos:
         subpaths = parent_to_subpaths.get(repo.path, [])
 
         # Also pick up indirect changes (e.g. child repos that received
-        # sync commits, updating the parent's submodule pointers).
-        result = repo.git("diff", "--name-only", check=False)
-        if result.returncode == 0 and result.stdout.strip():
-            existing = set(subpaths)
-            for changed_path in result.stdout.strip().split("\n"):
-                if changed_path and changed_path not in existing:
-                    subpaths.append(changed_path)
+        # sync commits, updating the parent's submodule pointers).  The same
+        # listing tells us which paths changed at all, so repos with nothing
+        # to commit are skipped without another git call.
+        # Unquoted and NUL-separated so non-ASCII paths match .gitmodules.
+        result = repo.git(
+            "-c", "core.quotePath=false", "diff", "--name-only", "-z", check=False
+        )
+        known = result.returncode == 0
+        if known:
+            changed = [p for p in result.stdout.split("\0") if p]
+            changed_set = set(changed)
+            subpaths = [p for p in subpaths if p.rstrip("/") in changed_set]
+            existing = {p.rstrip("/") for p in subpaths}
+            subpaths.extend(p for p in changed if p not in existing)
 
         if not subpaths:
             continue
@@ -632,6 +896,7 @@ def _commit_group_updates(
             subpaths,
             commit_message,
             dry_run=dry_run,
+            check_changes=not known,
         ):
             committed_repos.append(repo)
 
@@ -660,13 +925,30 @@ def _handle_no_push(
     return 0
 
 
-def _collect_repos_to_push(parent_repos: list[RepoInfo]) -> list[RepoInfo]:
+def _collect_repos_to_push(
+    parent_repos: list[RepoInfo],
+    committed_repos: list[RepoInfo],
+) -> list[RepoInfo]:
+    """Return the parent repos that have commits to push.
+
+    Phase 3 already computed ahead counts, so each sync commit just bumps
+    the count in place.  Only repos whose Phase 3 validation failed (which
+    we proceed past under ``--skip-checks``) are validated again.
+    """
+    committed = {repo.path for repo in committed_repos}
     repos_to_push: list[RepoInfo] = []
     for repo in parent_repos:
-        repo.ahead_count = None
-        repo.behind_count = None
-        repo.status = RepoStatus.OK
-        if repo.validate() and repo.status == RepoStatus.PENDING:
+        if repo.status not in (RepoStatus.UP_TO_DATE, RepoStatus.PENDING):
+            repo.reset_validation()
+            if repo.validate() and repo.status == RepoStatus.PENDING:
+                repos_to_push.append(repo)
+            continue
+
+        if repo.path in committed:
+            if repo.ahead_count != "new-branch":
+                repo.ahead_count = str(int(repo.ahead_count or "0") + 1)
+            repo.status = RepoStatus.PENDING
+        if repo.status == RepoStatus.PENDING:
             repos_to_push.append(repo)
     return repos_to_push
 
@@ -684,12 +966,38 @@ def _push_group_repositories(
 
     push_failed = False
     pushed_count = 0
-    for repo in topological_sort_repos(repos_to_push):
-        if repo.push(dry_run=dry_run):
-            pushed_count += 1
+    levels = topological_levels(repos_to_push)
+    for index, level in enumerate(levels):
+        # Repos within a level are independent; push them concurrently and
+        # report in a stable order once the whole level has finished.
+        quiet_push = len(level) > 1
+        if not quiet_push:
+            results = [level[0].push(dry_run=dry_run)]
         else:
-            push_failed = True
-            print(f"  {Colors.red('✗ Failed to push')} {repo.rel_path}")
+            for repo in level:
+                print(repo.describe_push())
+            results = map_concurrently(
+                lambda r: r.push(dry_run=dry_run, quiet=True), level
+            )
+
+        for repo, pushed in zip(level, results):
+            if pushed:
+                pushed_count += 1
+            else:
+                push_failed = True
+                print(f"  {Colors.red('✗ Failed to push')} {repo.rel_path}")
+                if quiet_push and repo.error_message:
+                    # git's output was captured; show why it failed.
+                    for line in repo.error_message.splitlines():
+                        print(f"      {line}")
+
+        # Parents would reference commits that never reached the remote.
+        skipped = sum(len(later) for later in levels[index + 1 :])
+        if push_failed and skipped:
+            print(
+                f"  {Colors.yellow(f'Skipped {skipped} parent repositories after push failure')}"
+            )
+            break
 
     if not quiet:
         print()
@@ -759,6 +1067,8 @@ def _sync_group(
     remote: bool = False,
     quiet: bool = False,
     source_path: Path | None = None,
+    full_fetch: bool = False,
+    gitmodules_paths: list[Path] | None = None,
 ) -> int:
     """Sync a single sync group. Returns 0 on success, 1 on failure.
 
@@ -767,6 +1077,9 @@ def _sync_group(
         source_path: Local path to fetch the target commit from.  When set
             with *commit_arg*, each submodule instance fetches from this path
             instead of ``--all`` remotes.
+        full_fetch: Fetch tags too instead of a tagless fetch.
+        gitmodules_paths: Pre-walked ``.gitmodules`` files, shared by
+            :func:`run` across groups.
     """
     if not quiet:
         print(Colors.blue(f"=== Syncing group: {group.name} ==="))
@@ -775,18 +1088,16 @@ def _sync_group(
     # Phase 1: Discover submodules
     if not quiet:
         print(Colors.blue(f"Discovering {group.name} submodule locations..."))
-    all_submodules = discover_sync_submodules(repo_root, group.url_match)
+    all_submodules = discover_sync_submodules(
+        repo_root, group.url_match, gitmodules_paths
+    )
 
     if not all_submodules:
         print(Colors.red(f"Error: No submodules found matching '{group.url_match}'"))
         return 1
 
     allow_drift = set(group.allow_drift)
-    submodules = [
-        s
-        for s in all_submodules
-        if str(s.path.relative_to(repo_root)) not in allow_drift
-    ]
+    submodules = [s for s in all_submodules if s.rel_path not in allow_drift]
 
     # Phase 2: Resolve target commit
     try:
@@ -800,6 +1111,8 @@ def _sync_group(
             force,
             quiet,
             source_path,
+            full_fetch,
+            gitmodules_paths,
         )
     except ValueError as e:
         if str(e) == "__PAUSED_OR_FAILED__":
@@ -812,7 +1125,6 @@ def _sync_group(
         print()
     _display_group_discovery(
         quiet,
-        repo_root,
         target_commit,
         all_submodules,
         allow_drift,
@@ -830,12 +1142,15 @@ def _sync_group(
             )
         return 0
 
-    # Phase 3: Validate parent repos
+    # Phase 3: Validate parent repos.  Only the chains above instances that
+    # will actually move get a commit, so parents of instances already at the
+    # target are neither fetched nor validated.
     validation_result, parent_repos = _validate_parent_repositories(
-        submodules,
+        submodules_to_update,
         repo_root,
         quiet,
         force,
+        full_fetch,
     )
     if validation_result != 0:
         return validation_result
@@ -847,12 +1162,12 @@ def _sync_group(
     # Phase 4: Update submodules
     updated_submodules = _update_group_submodules(
         submodules_to_update,
-        repo_root,
         group.name,
         target_commit,
         dry_run,
         quiet,
         source_path,
+        full_fetch,
     )
 
     if not updated_submodules:
@@ -865,13 +1180,17 @@ def _sync_group(
         group=group.name, sha=target_commit[:7]
     )
 
-    committed_repos = _commit_group_updates(
-        updated_submodules,
-        parent_repos,
-        commit_message,
-        dry_run,
-        quiet,
-    )
+    try:
+        committed_repos = _commit_group_updates(
+            updated_submodules,
+            parent_repos,
+            commit_message,
+            dry_run,
+            quiet,
+        )
+    except RuntimeError as e:
+        print(Colors.red(f"Error: {e}"))
+        return 1
 
     # Phase 6: Push (unless --no-push)
     if no_push:
@@ -884,8 +1203,7 @@ def _sync_group(
             print(Colors.green("No commits made - nothing to push."))
         return 0
 
-    # Re-validate repos to get accurate ahead counts
-    repos_to_push = _collect_repos_to_push(parent_repos)
+    repos_to_push = _collect_repos_to_push(parent_repos, committed_repos)
 
     if not repos_to_push and not dry_run:
         if quiet:
@@ -941,7 +1259,7 @@ def run(args) -> int:
     commit_arg = args.commit
 
     if group_name and group_name not in config.sync_groups:
-        if re.match(r"^[a-f0-9]{7,40}$", group_name):
+        if _SHA_RE.match(group_name):
             commit_arg = group_name
             group_name = None
         else:
@@ -954,6 +1272,9 @@ def run(args) -> int:
     else:
         groups = list(config.sync_groups.values())
 
+    # Walk the tree once; every group filters the same .gitmodules files.
+    gitmodules_paths = list(_iter_gitmodules_paths(repo_root))
+
     exit_code = 0
     for group in groups:
         result = _sync_group(
@@ -964,6 +1285,8 @@ def run(args) -> int:
             no_push=args.no_push,
             force=args.skip_checks,
             remote=args.remote,
+            full_fetch=getattr(args, "full_fetch", False),
+            gitmodules_paths=gitmodules_paths,
         )
         if result != 0:
             exit_code = result
@@ -12,12 +12,11 @@ machine pattern as ``worktree_merge.py`` and ``cascade.py``.
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
-from grove.filelock import atomic_write_json, locked_open
+from grove.filelock import atomic_write_json, dumps_json, loads_json, locked_open
 from grove.repo_utils import (
     Colors,
     find_repo_root,
@@ -45,13 +44,21 @@ class SyncMergeState:
     conflict_sha: str | None = None
 
     def save(self, state_path: Path) -> None:
-        data = asdict(self)
-        atomic_write_json(state_path, json.dumps(data, indent=2) + "\n")
+        data = {
+            "group_name": self.group_name,
+            "started_at": self.started_at,
+            "workspace_path": self.workspace_path,
+            "base_commit": self.base_commit,
+            "diverged_commits": self.diverged_commits,
+            "merged_sha": self.merged_sha,
+            "conflict_sha": self.conflict_sha,
+        }
+        atomic_write_json(state_path, dumps_json(data))
 
     @classmethod
     def load(cls, state_path: Path) -> SyncMergeState:
         with locked_open(state_path, "r", shared=True) as f:
-            data = json.loads(f.read())
+            data = loads_json(f.read())
         return cls(**data)
 
     @classmethod
@@ -89,13 +96,15 @@ def attempt_divergence_merge(
         return None
 
     # Collect unique diverged commits
-    commits: dict[str, Path] = {}
+    commit_list: list[tuple[str, Path]] = []
+    seen: set[str] = set()
     for sub in submodules:
-        sha = sub.get_current_commit()
-        if sha and sha not in commits:
-            commits[sha] = sub.path
+        sha = sub.current_commit or sub.get_current_commit()
+        if sha and sha not in seen:
+            seen.add(sha)
+            commit_list.append((sha, sub.path))
 
-    if len(commits) < 2:
+    if len(commit_list) < 2:
         print(Colors.red("Error: Expected diverged commits but found fewer than 2."))
         return None
 
@@ -104,32 +113,36 @@ def attempt_divergence_merge(
         workspace = standalone_repo
         workspace_desc = f"standalone repo ({standalone_repo})"
     else:
-        workspace = next(iter(commits.values()))
+        workspace = commit_list[0][1]
         workspace_desc = f"instance ({workspace})"
 
-    commit_list = list(commits.items())
     shas = [sha for sha, _ in commit_list]
 
     print(Colors.blue(f"Attempting to merge {len(shas)} diverged commits..."))
-    print(f"Workspace: {workspace_desc}")
+    # One write for the whole listing rather than one per commit.
+    lines = [f"Workspace: {workspace_desc}"]
     for sha, path in commit_list:
         rel = str(path.relative_to(repo_root)) if path != repo_root else "."
-        print(f"  {sha[:8]} from {rel}")
-    print()
+        lines.append(f"  {sha[:8]} from {rel}")
+    print("\n".join(lines), end="\n\n")
 
     if dry_run:
         print(Colors.yellow("(dry-run) Would attempt merge in workspace."))
         # Return a placeholder — the caller will skip update/commit phases
         return (shas[0], workspace, f"dry-run merge of {len(shas)} diverged commits")
 
-    # Fetch all diverged commits into workspace
+    # Fetch diverged commits the workspace does not already have (instances
+    # of one repo often share history, e.g. via an earlier sync).
+    workspace_resolved = workspace.resolve()
     for sha, source in commit_list:
-        if source.resolve() != workspace.resolve():
-            result = run_git(workspace, "fetch", str(source), sha, check=False)
-            if result.returncode != 0:
-                print(
-                    Colors.yellow(f"  Warning: Could not fetch {sha[:8]} from {source}")
-                )
+        if source.resolve() == workspace_resolved:
+            continue
+        present = run_git(workspace, "cat-file", "-e", f"{sha}^{{commit}}", check=False)
+        if present.returncode == 0:
+            continue
+        result = run_git(workspace, "fetch", str(source), sha, check=False)
+        if result.returncode != 0:
+            print(Colors.yellow(f"  Warning: Could not fetch {sha[:8]} from {source}"))
 
     # Find merge-base of the first two commits
     mb_result = run_git(workspace, "merge-base", shas[0], shas[1], check=False)
@@ -241,7 +254,6 @@ def continue_sync_merge() -> int:
     merged_sha_result = run_git(workspace, "rev-parse", "HEAD", check=False)
     merged_sha = merged_sha_result.stdout.strip()
 
-    state.merged_sha = merged_sha
     SyncMergeState.remove(state_path)
 
     print(Colors.green(f"Merge resolved: {merged_sha[:8]}"))
@@ -294,10 +306,12 @@ def show_sync_merge_status() -> int:
     print(f"Workspace: {state.workspace_path}")
     print(f"Base commit: {state.base_commit[:8]}")
     print()
-    print("Diverged commits:")
-    for entry in state.diverged_commits:
-        print(f"  {entry['sha'][:8]} from {entry['source_path']}")
-    print()
+    lines = ["Diverged commits:"]
+    lines.extend(
+        f"  {entry['sha'][:8]} from {entry['source_path']}"
+        for entry in state.diverged_commits
+    )
+    print("\n".join(lines), end="\n\n")
 
     if state.merged_sha:
         print(f"Merged to: {Colors.green(state.merged_sha[:8])}")
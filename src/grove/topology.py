@@ -12,17 +12,25 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urljoin
 
-from grove.filelock import atomic_write_json, locked_open
+from grove.filelock import atomic_write_json, dumps_json, loads_json, locked_open
+from grove.repo_utils import (
+    get_git_common_dir,
+    map_concurrently,
+    parse_gitmodules,
+    run_git,
+)
 
 
 DEFAULT_MAX_SNAPSHOTS = 500
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SubmoduleEntry:
     """A single submodule in a topology snapshot."""
 
@@ -36,6 +44,30 @@ class SubmoduleEntry:
         """Key used for topology hashing (excludes commit)."""
         return (self.rel_path, self.parent_rel_path, self.url)
 
+    @classmethod
+    def from_dict(cls, data: dict) -> SubmoduleEntry:
+        """Inverse of :meth:`to_dict`; a missing field raises ``TypeError``."""
+        try:
+            return cls(
+                data["rel_path"],
+                data["parent_rel_path"],
+                data["url"],
+                data["relative_url"],
+                data["commit"],
+            )
+        except KeyError as exc:
+            raise TypeError(f"topology entry is missing field {exc}") from None
+
+    def to_dict(self) -> dict[str, str | None]:
+        """Plain-dict form for the cache file (cheaper than ``asdict``)."""
+        return {
+            "rel_path": self.rel_path,
+            "parent_rel_path": self.parent_rel_path,
+            "url": self.url,
+            "relative_url": self.relative_url,
+            "commit": self.commit,
+        }
+
 
 @dataclass
 class TopologySnapshot:
@@ -102,33 +134,38 @@ def compute_topology_hash(entries: list[SubmoduleEntry]) -> str:
 
 def diff_snapshots(old: TopologySnapshot, new: TopologySnapshot) -> TopologyDiff:
     """Compare two topology snapshots and return a diff."""
-    old_by_path = {e.rel_path: e for e in old.entries}
-    new_by_path = {e.rel_path: e for e in new.entries}
-
-    old_paths = set(old_by_path)
-    new_paths = set(new_by_path)
+    # Index by path (a repeated path keeps its last entry), then walk both
+    # sorted lists together so every category comes out in path order.
+    old_entries = sorted({e.rel_path: e for e in old.entries}.items())
+    new_entries = sorted({e.rel_path: e for e in new.entries}.items())
 
     result = TopologyDiff()
 
-    # Added / removed
-    for p in sorted(new_paths - old_paths):
-        result.added.append(new_by_path[p])
-    for p in sorted(old_paths - new_paths):
-        result.removed.append(old_by_path[p])
-
-    # Changed (present in both)
-    for p in sorted(old_paths & new_paths):
-        o = old_by_path[p]
-        n = new_by_path[p]
-        if o.url != n.url:
-            result.changed_url.append((o, n))
-        if o.relative_url != n.relative_url:
-            result.changed_relative_url.append((o, n))
-        if o.parent_rel_path != n.parent_rel_path:
-            result.reparented.append((o, n))
-        if o.commit != n.commit:
-            result.changed_commit.append((o, n))
-
+    i = j = 0
+    while i < len(old_entries) and j < len(new_entries):
+        old_path, o = old_entries[i]
+        new_path, n = new_entries[j]
+        if old_path < new_path:
+            result.removed.append(o)
+            i += 1
+        elif new_path < old_path:
+            result.added.append(n)
+            j += 1
+        else:
+            # Changed (present in both)
+            if o.url != n.url:
+                result.changed_url.append((o, n))
+            if o.relative_url != n.relative_url:
+                result.changed_relative_url.append((o, n))
+            if o.parent_rel_path != n.parent_rel_path:
+                result.reparented.append((o, n))
+            if o.commit != n.commit:
+                result.changed_commit.append((o, n))
+            i += 1
+            j += 1
+
+    result.removed.extend(e for _, e in old_entries[i:])
+    result.added.extend(e for _, e in new_entries[j:])
     return result
 
 
@@ -147,9 +184,11 @@ def build_entries(repos, repo_root: Path) -> list[SubmoduleEntry]:
         repos: List of RepoInfo objects (from discover_repos_from_gitmodules).
         repo_root: Root repository path.
     """
-    from grove.repo_utils import parse_gitmodules, run_git
-
-    entries = []
+    pending: list[tuple[Path, str, str, str, str | None]] = []
+    # Siblings share a parent, so parse each .gitmodules and look up each
+    # parent's origin URL once rather than once per child.
+    gitmodules_urls: dict[Path, dict[str, str]] = {}
+    origin_urls: dict[Path, str | None] = {}
 
     for repo in repos:
         if repo.path == repo_root:
@@ -165,51 +204,63 @@ def build_entries(repos, repo_root: Path) -> list[SubmoduleEntry]:
         )
 
         # Parse parent's .gitmodules for this submodule's URL
-        gitmodules_path = parent_path / ".gitmodules"
-        sub_entries = parse_gitmodules(gitmodules_path)
+        urls = gitmodules_urls.get(parent_path)
+        if urls is None:
+            urls = {}
+            for _name, sm_path, sm_url in parse_gitmodules(parent_path / ".gitmodules"):
+                urls.setdefault(sm_path, sm_url)
+            gitmodules_urls[parent_path] = urls
 
         url = ""
         relative_url: str | None = None
-        submodule_rel = str(repo.path.relative_to(parent_path))
+        sm_url = urls.get(str(repo.path.relative_to(parent_path)))
 
-        for _name, sm_path, sm_url in sub_entries:
-            if sm_path == submodule_rel:
-                if _is_relative_url(sm_url):
-                    relative_url = sm_url
-                    # Resolve to absolute by getting the remote URL of the parent
+        if sm_url is not None:
+            if _is_relative_url(sm_url):
+                relative_url = sm_url
+                # Resolve to absolute by getting the remote URL of the parent
+                if parent_path not in origin_urls:
                     result = run_git(
                         parent_path, "remote", "get-url", "origin", check=False
                     )
-                    if result.returncode == 0:
-                        parent_url = result.stdout.strip()
-                        # Resolve relative URL against parent's remote
-                        url = _resolve_relative_url(parent_url, sm_url)
-                    else:
-                        url = sm_url
+                    origin_urls[parent_path] = (
+                        result.stdout.strip() if result.returncode == 0 else None
+                    )
+                parent_url = origin_urls[parent_path]
+                if parent_url is not None:
+                    # Resolve relative URL against parent's remote
+                    url = _resolve_relative_url(parent_url, sm_url)
                 else:
                     url = sm_url
-                    relative_url = None
-                break
-
-        # Get current commit hash
-        result = run_git(repo.path, "rev-parse", "--short", "HEAD", check=False)
-        commit = result.stdout.strip() if result.returncode == 0 else "unknown"
+            else:
+                url = sm_url
 
         rel_path = str(repo.path.relative_to(repo_root))
 
-        entries.append(
-            SubmoduleEntry(
-                rel_path=rel_path,
-                parent_rel_path=parent_rel,
-                url=url,
-                relative_url=relative_url,
-                commit=commit,
-            )
-        )
+        pending.append((repo.path, rel_path, parent_rel, url, relative_url))
 
-    return entries
+    def short_head(path: Path) -> str:
+        result = run_git(path, "rev-parse", "--short", "HEAD", check=False)
+        return result.stdout.strip() if result.returncode == 0 else "unknown"
 
+    # One rev-parse per submodule; they are independent, so overlap them.
+    commits = map_concurrently(short_head, [p[0] for p in pending])
 
+    return [
+        SubmoduleEntry(
+            rel_path=rel_path,
+            parent_rel_path=parent_rel,
+            url=url,
+            relative_url=relative_url,
+            commit=commit,
+        )
+        for (_path, rel_path, parent_rel, url, relative_url), commit in zip(
+            pending, commits
+        )
+    ]
+
+
+@lru_cache(maxsize=1024)
 def _resolve_relative_url(parent_url: str, relative: str) -> str:
     """Resolve a relative submodule URL against a parent remote URL.
 
@@ -240,8 +291,6 @@ def _resolve_relative_url(parent_url: str, relative: str) -> str:
 
     # Handle HTTP(S) URLs
     if base.startswith(("http://", "https://")):
-        from urllib.parse import urljoin
-
         # urljoin needs a trailing slash on the "directory"
         if not base.endswith("/"):
             base = base.rsplit("/", 1)[0] + "/"
@@ -263,6 +312,10 @@ class TopologyCache:
     def __init__(self, cache_path: Path) -> None:
         self.cache_path = cache_path
         self.snapshots: list[TopologySnapshot] = []
+        # Commit -> snapshot index over ``snapshots``; see _index().
+        self._by_commit: dict[str, TopologySnapshot] = {}
+        self._indexed_list: list[TopologySnapshot] | None = None
+        self._indexed_len = 0
 
     @classmethod
     def for_repo(cls, repo_root: Path) -> TopologyCache:
@@ -270,21 +323,22 @@ class TopologyCache:
 
         Uses ``--git-common-dir`` so the cache is shared across worktrees.
         """
-        from grove.repo_utils import get_git_common_dir
-
         return cls(get_git_common_dir(repo_root) / "grove" / "topology.json")
 
     def load(self) -> None:
         """Load snapshots from disk."""
+        self._indexed_list = None
         if not self.cache_path.exists():
             self.snapshots = []
             return
 
         with locked_open(self.cache_path, "r", shared=True) as f:
-            data = json.loads(f.read())
+            data = loads_json(f.read())
         self.snapshots = []
         for snap_data in data.get("snapshots", []):
-            entries = [SubmoduleEntry(**e) for e in snap_data.get("entries", [])]
+            entries = [
+                SubmoduleEntry.from_dict(e) for e in snap_data.get("entries", [])
+            ]
             self.snapshots.append(
                 TopologySnapshot(
                     root_commit=snap_data["root_commit"],
@@ -302,23 +356,37 @@ class TopologyCache:
                     "root_commit": s.root_commit,
                     "timestamp": s.timestamp,
                     "topology_hash": s.topology_hash,
-                    "entries": [asdict(e) for e in s.entries],
+                    "entries": [e.to_dict() for e in s.entries],
                 }
                 for s in self.snapshots
             ]
         }
-        atomic_write_json(self.cache_path, json.dumps(data, indent=2) + "\n")
+        atomic_write_json(self.cache_path, dumps_json(data))
 
-    def record(self, root_commit: str, repos, repo_root: Path) -> None:
+    def record(self, root_commit: str, repos, repo_root: Path) -> bool:
         """Record a topology snapshot from discovered repos.
 
         Skips recording if the root commit is already cached.
+
+        Returns:
+            True if a snapshot was added (i.e. the cache needs saving).
         """
         if self.get(root_commit) is not None:
-            return
+            return False
 
         entries = build_entries(repos, repo_root)
-        topology_hash = compute_topology_hash(entries)
+        # Most commits only move submodule pointers, so the structure (and
+        # hence the hash) usually matches the latest snapshot.
+        prev = self.snapshots[-1] if self.snapshots else None
+        if (
+            prev is not None
+            and len(prev.entries) == len(entries)
+            and {e.structure_key() for e in prev.entries}
+            == {e.structure_key() for e in entries}
+        ):
+            topology_hash = prev.topology_hash
+        else:
+            topology_hash = compute_topology_hash(entries)
         timestamp = datetime.now(timezone.utc).isoformat()
 
         self.snapshots.append(
@@ -329,13 +397,26 @@ class TopologyCache:
                 entries=entries,
             )
         )
+        return True
+
+    def _index(self) -> dict[str, TopologySnapshot]:
+        """Return the commit index, rebuilding it if ``snapshots`` changed.
+
+        Appends are caught by the length check.  prune() and load() can
+        leave the length unchanged, so they drop the index explicitly.
+        """
+        snapshots = self.snapshots
+        if self._indexed_list is not snapshots or self._indexed_len != len(snapshots):
+            self._by_commit = {}
+            for snap in snapshots:
+                self._by_commit.setdefault(snap.root_commit, snap)
+            self._indexed_list = snapshots
+            self._indexed_len = len(snapshots)
+        return self._by_commit
 
     def get(self, commit: str) -> TopologySnapshot | None:
         """Look up a snapshot by root commit SHA."""
-        for snap in self.snapshots:
-            if snap.root_commit == commit:
-                return snap
-        return None
+        return self._index().get(commit)
 
     def compare(self, sha1: str, sha2: str) -> TopologyDiff | None:
         """Compare two snapshots by root commit SHA.
@@ -350,5 +431,8 @@ class TopologyCache:
 
     def prune(self, max_entries: int = DEFAULT_MAX_SNAPSHOTS) -> None:
         """Remove oldest snapshots beyond the cap."""
-        if len(self.snapshots) > max_entries:
-            self.snapshots = self.snapshots[-max_entries:]
+        excess = len(self.snapshots) - max_entries
+        if excess > 0:
+            # Trim in place rather than copying the snapshots being kept.
+            del self.snapshots[:excess]
+            self._indexed_list = None
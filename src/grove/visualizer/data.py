@@ -7,15 +7,21 @@ dictionaries for the frontend API.
 
 from __future__ import annotations
 
+import re
 import subprocess
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from grove.repo_utils import map_concurrently
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from grove.repo_utils import RepoInfo
 
 # Palette of visually distinct colors for sync-group borders
-SYNC_GROUP_PALETTE = [
+SYNC_GROUP_PALETTE = (
     "#2196F3",  # Blue
     "#9C27B0",  # Purple
     "#009688",  # Teal
@@ -24,18 +30,42 @@ SYNC_GROUP_PALETTE = [
     "#00BCD4",  # Cyan
     "#795548",  # Brown
     "#607D8B",  # Blue Gray
-]
+)
+
+# Leading options for the read-only git commands run below.  The visualizer
+# polls trees the user may be working in; without --no-optional-locks,
+# status-style commands opportunistically rewrite the index and can collide
+# with the user's own git commands on index.lock.
+_GIT_READ_ARGS = ("git", "--no-optional-locks")
+
+
+def _head_summary(repo: RepoInfo) -> tuple[str, str | None, str]:
+    """Return HEAD's short SHA, a tag pointing at it, and its subject.
+
+    One ``git log`` call replaces separate ``rev-parse``, ``describe`` and
+    ``log`` invocations; the tag is read from HEAD's decorations.
+    """
+    result = repo.git("log", "-1", "--format=%h%n%D%n%s", check=False)
+    if result.returncode != 0:
+        return ("unknown", None, "")
+    sha, decorations, subject = result.stdout.split("\n")[:3]
+    tag = next(
+        (ref[5:] for ref in decorations.split(", ") if ref.startswith("tag: ")), None
+    )
+    return (sha, tag, subject)
 
 
 def repo_to_dict(repo: RepoInfo) -> dict:
     """Convert a RepoInfo to a JSON-serializable dict."""
+    commit, commit_tag, commit_message = _head_summary(repo)
+    local_branches, remote_branches = repo.get_branches()
     return {
         "path": str(repo.path),
         "rel_path": repo.rel_path,
         "name": repo.name,
         "is_root": repo.path == repo.repo_root,
         "branch": repo.branch,
-        "commit": repo.get_commit_sha(short=True),
+        "commit": commit,
         "ahead": repo.ahead_count or "0",
         "behind": repo.behind_count or "0",
         "status": repo.status.name if repo.status else "OK",
@@ -45,55 +75,156 @@ def repo_to_dict(repo: RepoInfo) -> dict:
         "sync_group": repo.sync_group,
         "sync_group_color": repo.sync_group_color,
         "remote_url": repo.get_remote_url(),
-        "commit_tag": repo.get_commit_tag(),
-        "commit_message": repo.get_commit_message(),
+        "commit_tag": commit_tag,
+        "commit_message": commit_message,
         "changed_files": repo.get_changed_files()
         if repo.status and repo.status.name == "UNCOMMITTED"
         else [],
-        "local_branches": repo.get_local_branches(),
-        "remote_branches": repo.get_remote_branches(),
+        "local_branches": local_branches,
+        "remote_branches": remote_branches,
     }
 
 
 def repos_to_json(repos: list[RepoInfo]) -> dict:
-    """Convert a full repo list to the JSON payload for /api/repos."""
+    """Convert a full repo list to the JSON payload for /api/repos.
+
+    Each repo's entry takes several git calls, so they are built
+    concurrently.
+    """
     return {
-        "repos": [repo_to_dict(r) for r in repos],
+        "repos": map_concurrently(repo_to_dict, repos),
         "repo_root": str(repos[0].repo_root) if repos else "",
     }
 
 
+# A saved /api/repos payload older than this is not shown at startup.
+STATE_CACHE_MAX_AGE = 24 * 60 * 60
+
+
+def _state_cache_path(repo_path: Path) -> Path:
+    """Per-worktree location of the last served /api/repos payload."""
+    from grove.repo_utils import get_git_worktree_dir
+
+    return get_git_worktree_dir(repo_path) / "grove" / "visualizer.json"
+
+
+def load_cached_repos_json(repo_path: Path) -> dict | None:
+    """Return the last saved /api/repos payload, or None if missing or stale."""
+    from grove.filelock import loads_json
+
+    path = _state_cache_path(repo_path)
+    try:
+        if time.time() - path.stat().st_mtime > STATE_CACHE_MAX_AGE:
+            return None
+        return loads_json(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_repos_json(repo_path: Path, payload: dict) -> None:
+    """Save *payload* so the next start can show it while repos load."""
+    from grove.filelock import atomic_write_json, dumps_json
+
+    try:
+        atomic_write_json(_state_cache_path(repo_path), dumps_json(payload))
+    except OSError:
+        pass  # only a startup shortcut; never fail a request over it
+
+
 def load_and_validate_repos(repo_path: Path) -> list[RepoInfo]:
     """Load repos from a path, validate them, and populate sync groups."""
     from grove.repo_utils import discover_repos_from_gitmodules
 
     repos = discover_repos_from_gitmodules(repo_path)
-    for repo in repos:
-        repo.validate(check_sync=True, allow_detached=True, allow_no_remote=True)
+    validate_repos(repos)
 
     _populate_sync_groups(repos, repo_path)
     return repos
 
 
+def validate_repos(repos: list[RepoInfo]) -> None:
+    """Validate every repo for display, running their git checks concurrently."""
+    map_concurrently(
+        lambda repo: repo.validate(
+            check_sync=True, allow_detached=True, allow_no_remote=True
+        ),
+        repos,
+    )
+
+
+# Last sync-group tagging per project root, as (input mtimes, path -> group).
+_sync_group_cache: dict[Path, tuple[tuple, dict[Path, tuple[str, str]]]] = {}
+
+
+def _stat_key(paths) -> tuple:
+    """Return a cache key that changes whenever any of *paths* changes."""
+    key = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            key.append((path, None))
+        else:
+            key.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(key)
+
+
 def _populate_sync_groups(repos: list[RepoInfo], repo_path: Path) -> None:
-    """Tag repos with their sync-group name and color."""
-    try:
-        from grove.config import load_config
-        from grove.sync import discover_sync_submodules
+    """Tag repos with their sync-group name and color.
 
-        config = load_config(repo_path)
-    except (FileNotFoundError, ValueError):
-        return
+    The result depends only on the Grove config files and the repos'
+    ``.gitmodules`` files, so it is reused until one of them changes.
+    Otherwise each ``.gitmodules`` is parsed once and every group's
+    ``url_match`` is tested against the entries in memory.
+    """
+    from grove.user_config import iter_grove_config_paths
 
-    path_to_group: dict[Path, tuple[str, str]] = {}
-    for i, group in enumerate(config.sync_groups.values()):
-        color = SYNC_GROUP_PALETTE[i % len(SYNC_GROUP_PALETTE)]
-        for sub in discover_sync_submodules(repo_path, group.url_match):
-            path_to_group[sub.path] = (group.name, color)
+    key = _stat_key(
+        [*iter_grove_config_paths(repo_path), *(r.path / ".gitmodules" for r in repos)]
+    )
+    cached = _sync_group_cache.get(repo_path)
+    if cached is not None and cached[0] == key:
+        path_to_group = cached[1]
+    else:
+        try:
+            path_to_group = _scan_sync_groups(repos, repo_path)
+        except (FileNotFoundError, ValueError):
+            return
+        _sync_group_cache[repo_path] = (key, path_to_group)
 
     for repo in repos:
-        if repo.path in path_to_group:
-            repo.sync_group, repo.sync_group_color = path_to_group[repo.path]
+        group = path_to_group.get(repo.path)
+        if group is not None:
+            repo.sync_group, repo.sync_group_color = group
+
+
+def _scan_sync_groups(
+    repos: list[RepoInfo], repo_path: Path
+) -> dict[Path, tuple[str, str]]:
+    """Map submodule paths to ``(group name, color)`` from the current config."""
+    from grove.config import load_config
+    from grove.repo_utils import parse_gitmodules
+
+    config = load_config(repo_path)
+    groups = [
+        (group.url_match, group.name, SYNC_GROUP_PALETTE[i % len(SYNC_GROUP_PALETTE)])
+        for i, group in enumerate(config.sync_groups.values())
+    ]
+    if not groups:
+        return {}
+
+    # Every parent of a displayed submodule is itself a displayed repo, so
+    # the repos' own .gitmodules files are all that needs reading.
+    path_to_group: dict[Path, tuple[str, str]] = {}
+    for parent_repo in repos:
+        for _name, submodule_path, url in parse_gitmodules(
+            parent_repo.path / ".gitmodules"
+        ):
+            # Later groups win, as when each group was scanned in turn.
+            for url_match, name, color in groups:
+                if url_match in url:
+                    path_to_group[parent_repo.path / submodule_path] = (name, color)
+    return path_to_group
 
 
 def discover_worktrees(repo_root: Path) -> list[dict]:
@@ -102,7 +233,7 @@ def discover_worktrees(repo_root: Path) -> list[dict]:
     Returns a list of dicts with keys: path, branch, head, is_bare.
     """
     result = subprocess.run(
-        ["git", "-C", str(repo_root), "worktree", "list", "--porcelain"],
+        [*_GIT_READ_ARGS, "-C", str(repo_root), "worktree", "list", "--porcelain"],
         capture_output=True,
         text=True,
         check=False,
@@ -110,41 +241,23 @@ def discover_worktrees(repo_root: Path) -> list[dict]:
     if result.returncode != 0:
         return []
 
+    # Porcelain output is one blank-line separated block per worktree.
     worktrees: list[dict] = []
-    current: dict = {}
-
-    for line in result.stdout.split("\n"):
-        line = line.strip()
-        if not line:
-            if current:
-                worktrees.append(current)
-                current = {}
-            continue
-
-        if line.startswith("worktree "):
-            current["path"] = line[9:]
-        elif line.startswith("HEAD "):
-            current["head"] = line[5:]
-        elif line.startswith("branch "):
-            # refs/heads/main -> main
-            ref = line[7:]
-            if ref.startswith("refs/heads/"):
-                current["branch"] = ref[11:]
-            else:
-                current["branch"] = ref
-        elif line == "bare":
-            current["is_bare"] = True
-        elif line == "detached":
-            current.setdefault("branch", None)
-
-    if current:
-        worktrees.append(current)
-
-    # Fill in defaults
-    for wt in worktrees:
-        wt.setdefault("branch", None)
-        wt.setdefault("head", "")
-        wt.setdefault("is_bare", False)
+    for block in result.stdout.split("\n\n"):
+        wt: dict = {"branch": None, "head": "", "is_bare": False}
+        for line in block.splitlines():
+            key, _, value = line.partition(" ")
+            if key == "worktree":
+                wt["path"] = value
+            elif key == "HEAD":
+                wt["head"] = value
+            elif key == "branch":
+                # refs/heads/main -> main
+                wt["branch"] = value.removeprefix("refs/heads/")
+            elif key == "bare":
+                wt["is_bare"] = True
+        if "path" in wt:
+            worktrees.append(wt)
 
     return worktrees
 
@@ -164,24 +277,34 @@ def worktrees_to_json(repo_root: Path) -> dict:
     for wt in worktrees:
         wt["is_current"] = str(Path(wt["path"]).resolve()) == resolved_root
 
-    # Compute diff counts relative to the first (main) worktree
-    main_path = Path(worktrees[0]["path"])
-    main_commits = _submodule_commits(main_path)
+    # Compute diff counts relative to the first (main) worktree.  Each
+    # worktree's submodule scan is independent, so they run concurrently.
+    main, *others = worktrees
+    main_commits, *other_commits = map_concurrently(
+        _submodule_commits, [Path(wt["path"]) for wt in worktrees]
+    )
 
-    for wt in worktrees:
-        if wt["path"] == str(main_path):
-            wt["diff_count"] = 0
-        else:
-            other_commits = _submodule_commits(Path(wt["path"]))
-            wt["diff_count"] = _count_differences(main_commits, other_commits)
+    main["diff_count"] = 0
+    for wt, commits in zip(others, other_commits):
+        wt["diff_count"] = _count_differences(main_commits, commits)
 
     return {"worktrees": worktrees}
 
 
+_SUBMODULE_STATUS_RE = re.compile(r"^[ +U-]?([0-9a-f]+) (\S+)", re.MULTILINE)
+
+
 def _submodule_commits(repo_path: Path) -> dict[str, str]:
     """Get a mapping of submodule relative path -> current commit SHA."""
     result = subprocess.run(
-        ["git", "-C", str(repo_path), "submodule", "status", "--recursive"],
+        [
+            *_GIT_READ_ARGS,
+            "-C",
+            str(repo_path),
+            "submodule",
+            "status",
+            "--recursive",
+        ],
         capture_output=True,
         text=True,
         check=False,
@@ -189,19 +312,11 @@ def _submodule_commits(repo_path: Path) -> dict[str, str]:
     if result.returncode != 0:
         return {}
 
-    commits: dict[str, str] = {}
-    for line in result.stdout.strip().split("\n"):
-        if not line.strip():
-            continue
-        # Format: " <sha> <path> (<describe>)" or "+<sha> <path> (<describe>)"
-        line = line.strip()
-        if line.startswith("+") or line.startswith("-") or line.startswith("U"):
-            line = line[1:]
-        parts = line.split(None, 2)
-        if len(parts) >= 2:
-            commits[parts[1]] = parts[0]
-
-    return commits
+    # Format: " <sha> <path> (<describe>)", with "+", "-" or "U" in place
+    # of the leading space for moved, uninitialized or conflicted entries.
+    return {
+        m.group(2): m.group(1) for m in _SUBMODULE_STATUS_RE.finditer(result.stdout)
+    }
 
 
 def _count_differences(base: dict[str, str], other: dict[str, str]) -> int:
@@ -214,14 +329,32 @@ def _count_differences(base: dict[str, str], other: dict[str, str]) -> int:
     return diff
 
 
-def compare_worktrees(base_path: Path, other_path: Path) -> dict:
-    """Compare two worktrees and return a diff summary."""
-    base_repos = load_and_validate_repos(base_path)
-    other_repos = load_and_validate_repos(other_path)
+def compare_worktrees(
+    base_path: Path,
+    other_path: Path,
+    load_repos: Callable[[Path], list[RepoInfo]] | None = None,
+) -> dict:
+    """Compare two worktrees and return a diff summary.
+
+    *load_repos* supplies the validated repos for a worktree path; the
+    server passes one that reuses the repos it already holds for its own
+    worktree.  Defaults to ``load_and_validate_repos``.
+    """
+    if load_repos is None:
+        load_repos = load_and_validate_repos
+    base_repos = load_repos(base_path)
+    other_repos = load_repos(other_path)
 
     base_map = {r.rel_path: r for r in base_repos}
     other_map = {r.rel_path: r for r in other_repos}
 
+    # One rev-parse per repo, looked up below; run them all concurrently.
+    shas = map_concurrently(
+        lambda r: r.get_commit_sha(short=True), base_repos + other_repos
+    )
+    base_shas = dict(zip((r.rel_path for r in base_repos), shas))
+    other_shas = dict(zip((r.rel_path for r in other_repos), shas[len(base_repos) :]))
+
     all_paths = sorted(set(base_map) | set(other_map))
 
     same = []
@@ -236,8 +369,8 @@ def compare_worktrees(base_path: Path, other_path: Path) -> dict:
         if in_base and in_other:
             b = base_map[rel_path]
             o = other_map[rel_path]
-            b_commit = b.get_commit_sha(short=True)
-            o_commit = o.get_commit_sha(short=True)
+            b_commit = base_shas[rel_path]
+            o_commit = other_shas[rel_path]
 
             if b_commit == o_commit and b.branch == o.branch:
                 same.append(
@@ -269,7 +402,7 @@ def compare_worktrees(base_path: Path, other_path: Path) -> dict:
                 {
                     "rel_path": rel_path,
                     "branch": b.branch,
-                    "commit": b.get_commit_sha(short=True),
+                    "commit": base_shas[rel_path],
                 }
             )
         else:
@@ -278,7 +411,7 @@ def compare_worktrees(base_path: Path, other_path: Path) -> dict:
                 {
                     "rel_path": rel_path,
                     "branch": o.branch,
-                    "commit": o.get_commit_sha(short=True),
+                    "commit": other_shas[rel_path],
                 }
             )
 
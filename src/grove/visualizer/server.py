@@ -16,10 +16,17 @@ from pathlib import Path
 from socketserver import ThreadingMixIn
 from urllib.parse import parse_qs, urlparse
 
+from grove.filelock import encode_json
+from grove.repo_utils import map_concurrently, topological_levels
+
 from .data import (
     compare_worktrees,
     load_and_validate_repos,
+    load_cached_repos_json,
+    repo_to_dict,
     repos_to_json,
+    save_cached_repos_json,
+    validate_repos,
     worktrees_to_json,
 )
 
@@ -46,20 +53,79 @@ STATIC_FILES = {
 class VisualizerState:
     """Shared mutable state for the visualizer server."""
 
-    def __init__(self, repo_path: Path):
+    def __init__(self, repo_path: Path, background: bool = False):
+        """Load the repository data, or start loading it on a thread.
+
+        With *background*, the constructor returns immediately and readers
+        block until the first load has finished.  Until then
+        ``/api/repos?allow_stale=1`` serves the payload saved by the
+        previous run, if any.
+        """
         self.repo_path = repo_path
         self.repos = []
         self.lock = threading.Lock()
-        self.reload()
+        self._loaded = threading.Event()
+        # Serialising a repo runs several git commands (branches, commit
+        # message, tag, ...), so the payload is kept until the data changes.
+        self._repos_json: dict | None = None
+        # Last payload from a previous run, served (marked stale) to callers
+        # that allow it until the first load completes, so the page can
+        # draw immediately.
+        self._cached_json: dict | None = None
+        if background:
+            self._cached_json = load_cached_repos_json(repo_path)
+            threading.Thread(target=self._initial_load, daemon=True).start()
+        else:
+            self._initial_load()
+
+    def _initial_load(self):
+        try:
+            self.reload()
+        finally:
+            self._cached_json = None
+            self._loaded.set()
 
     def reload(self):
         """Reload repository data (thread-safe)."""
         with self.lock:
             self.repos = load_and_validate_repos(self.repo_path)
+            self._repos_json = None
 
-    def get_repos_json(self) -> dict:
+    def invalidate(self):
+        """Drop the cached /api/repos payload after a repo was modified."""
         with self.lock:
-            return repos_to_json(self.repos)
+            self._repos_json = None
+
+    def wait_loaded(self):
+        """Block until the initial load has finished."""
+        self._loaded.wait()
+
+    def get_repos_json(self, allow_stale: bool = False) -> dict:
+        """Return the /api/repos payload.
+
+        With *allow_stale*, a payload saved by a previous run is returned
+        (marked ``"stale"``) instead of waiting for the first load.
+        """
+        cached = self._cached_json
+        if allow_stale and cached is not None:
+            return {**cached, "stale": True}
+        self.wait_loaded()
+        with self.lock:
+            if self._repos_json is None:
+                self._repos_json = repos_to_json(self.repos)
+                save_cached_repos_json(self.repo_path, self._repos_json)
+            return self._repos_json
+
+    def is_own_worktree(self, path: Path) -> bool:
+        return path.resolve() == self.repo_path.resolve()
+
+    def repos_for(self, path: Path) -> list:
+        """Return validated repos for *path*, reusing ours for our worktree."""
+        if self.is_own_worktree(path):
+            self.wait_loaded()
+            with self.lock:
+                return list(self.repos)
+        return load_and_validate_repos(path)
 
     def get_worktrees_json(self) -> dict:
         with self.lock:
@@ -67,6 +133,7 @@ class VisualizerState:
 
     def find_repo(self, path_str: str):
         """Find a RepoInfo by its path string."""
+        self.wait_loaded()
         with self.lock:
             for repo in self.repos:
                 if str(repo.path) == path_str:
@@ -93,7 +160,9 @@ class _VisualizerHandlerBase(BaseHTTPRequestHandler):
 
         # API endpoints
         if path == "/api/repos":
-            self._json_response(self.state.get_repos_json())
+            params = parse_qs(parsed.query)
+            allow_stale = params.get("allow_stale", ["0"])[0] == "1"
+            self._json_response(self.state.get_repos_json(allow_stale=allow_stale))
             return
 
         if path == "/api/worktrees":
@@ -105,8 +174,11 @@ class _VisualizerHandlerBase(BaseHTTPRequestHandler):
             wt_path = params.get("path", [None])[0]
             if wt_path:
                 try:
-                    repos = load_and_validate_repos(Path(wt_path))
-                    self._json_response(repos_to_json(repos))
+                    if self.state.is_own_worktree(Path(wt_path)):
+                        self._json_response(self.state.get_repos_json())
+                    else:
+                        repos = load_and_validate_repos(Path(wt_path))
+                        self._json_response(repos_to_json(repos))
                 except Exception as e:
                     self._json_response({"ok": False, "error": str(e)}, status=500)
             else:
@@ -121,7 +193,9 @@ class _VisualizerHandlerBase(BaseHTTPRequestHandler):
             other = params.get("other", [None])[0]
             if base and other:
                 try:
-                    result = compare_worktrees(Path(base), Path(other))
+                    result = compare_worktrees(
+                        Path(base), Path(other), load_repos=self.state.repos_for
+                    )
                     self._json_response(result)
                 except Exception as e:
                     self._json_response({"ok": False, "error": str(e)}, status=500)
@@ -139,6 +213,7 @@ class _VisualizerHandlerBase(BaseHTTPRequestHandler):
         path = parsed.path
         body = self._read_json_body()
         state = self.state
+        state.wait_loaded()
 
         if path == "/api/action/refresh":
             state.reload()
@@ -159,24 +234,23 @@ class _VisualizerHandlerBase(BaseHTTPRequestHandler):
                 repo.validate(
                     check_sync=True, allow_detached=True, allow_no_remote=True
                 )
+                state.invalidate()
             self._json_response(
                 {
                     "ok": success,
                     "error": "" if success else f"Fetch failed for {repo.name}",
+                    "repo": repo_to_dict(repo),
                 }
             )
             return
 
         if path == "/api/action/fetch-all":
-            failed = []
             with state.lock:
-                for repo in state.repos:
-                    if not repo.fetch():
-                        failed.append(repo.name)
-                for repo in state.repos:
-                    repo.validate(
-                        check_sync=True, allow_detached=True, allow_no_remote=True
-                    )
+                # Fetches are independent network round-trips; overlap them.
+                fetched = map_concurrently(lambda r: r.fetch(), state.repos)
+                failed = [r.name for r, ok in zip(state.repos, fetched) if not ok]
+                validate_repos(state.repos)
+            state.invalidate()
             self._json_response(
                 {
                     "ok": len(failed) == 0,
@@ -202,34 +276,37 @@ class _VisualizerHandlerBase(BaseHTTPRequestHandler):
                 repo.validate(
                     check_sync=True, allow_detached=True, allow_no_remote=True
                 )
+                state.invalidate()
             self._json_response(
                 {
                     "ok": success,
                     "error": "" if success else f"Push failed for {repo.name}",
+                    "repo": repo_to_dict(repo),
                 }
             )
             return
 
         if path == "/api/action/push-all":
-            from grove.repo_utils import topological_sort_repos
-
             with state.lock:
                 to_push = [r for r in state.repos if r.ahead_count not in ("0", None)]
                 if not to_push:
                     self._json_response({"ok": True, "error": "Nothing to push"})
                     return
 
-                sorted_repos = topological_sort_repos(to_push)
+                # Children must be pushed before their parents, but repos
+                # within one level are independent and push concurrently.
                 failed = []
-                for repo in sorted_repos:
-                    if not repo.push():
-                        failed.append(repo.name)
-
-                for repo in state.repos:
-                    repo.validate(
-                        check_sync=True, allow_detached=True, allow_no_remote=True
+                for level in topological_levels(to_push):
+                    pushed = map_concurrently(lambda r: r.push(quiet=True), level)
+                    failed.extend(
+                        f"{r.name} ({r.error_message})"
+                        for r, ok in zip(level, pushed)
+                        if not ok
                     )
 
+                validate_repos(state.repos)
+            state.invalidate()
+
             self._json_response(
                 {
                     "ok": len(failed) == 0,
@@ -258,6 +335,7 @@ class _VisualizerHandlerBase(BaseHTTPRequestHandler):
                 repo.validate(
                     check_sync=True, allow_detached=True, allow_no_remote=True
                 )
+                state.invalidate()
             self._json_response({"ok": success, "error": error})
             return
 
@@ -283,7 +361,7 @@ class _VisualizerHandlerBase(BaseHTTPRequestHandler):
 
     def _json_response(self, data: dict, status: int = 200):
         """Send a JSON response."""
-        body = json.dumps(data).encode("utf-8")
+        body = encode_json(data)
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(body)))
@@ -344,7 +422,9 @@ def start_server(repo_path: Path, open_browser: bool = True) -> int:
     """
     import webbrowser
 
-    state = VisualizerState(repo_path)
+    # Discovery and validation can take a while on large trees; serve the
+    # page right away and let /api/repos wait for the data instead.
+    state = VisualizerState(repo_path, background=True)
     port = find_free_port()
     handler_class = make_handler_class(state)
     server = ThreadedHTTPServer(("127.0.0.1", port), handler_class)
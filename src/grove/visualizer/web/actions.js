@@ -11,6 +11,7 @@ const Actions = (() => {
     let onActionComplete = null;
     let currentCheckoutRepo = null;
     let selectedBranch = null;
+    let selectedItem = null;
 
     function init(callbacks) {
         onActionComplete = callbacks.onActionComplete;
@@ -48,12 +49,12 @@ const Actions = (() => {
             items.removeChild(items.firstChild);
         }
 
-        addMenuItem(items, `Fetch ${repo.name}`, () => postAction('/api/action/fetch', { path: repo.path }));
-        addMenuItem(items, `Push ${repo.name}`, () => postAction('/api/action/push', { path: repo.path }));
+        addMenuItem(items, `Fetch ${repo.name}`, () => postAction('/api/action/fetch', { path: repo.path }, false));
+        addMenuItem(items, `Push ${repo.name}`, () => postAction('/api/action/push', { path: repo.path }, false));
         addMenuItem(items, 'Checkout Branch...', () => showBranchPicker(repo));
         addSeparator(items);
-        addMenuItem(items, 'Fetch All', () => postAction('/api/action/fetch-all', {}));
-        addMenuItem(items, 'Push All', () => postAction('/api/action/push-all', {}));
+        addMenuItem(items, 'Fetch All', () => postAction('/api/action/fetch-all', {}, false));
+        addMenuItem(items, 'Push All', () => postAction('/api/action/push-all', {}, false));
 
         // Position the menu
         contextMenu.style.left = `${x}px`;
@@ -97,54 +98,45 @@ const Actions = (() => {
     function showBranchPicker(repo) {
         currentCheckoutRepo = repo;
         selectedBranch = null;
+        selectedItem = null;
 
         const localList = document.getElementById('local-branches');
         const remoteList = document.getElementById('remote-branches');
         const checkoutBtn = document.getElementById('btn-checkout');
 
-        // Clear lists using safe DOM methods
-        while (localList.firstChild) {
-            localList.removeChild(localList.firstChild);
-        }
-        while (remoteList.firstChild) {
-            remoteList.removeChild(remoteList.firstChild);
-        }
         checkoutBtn.disabled = true;
 
-        // Populate local branches
+        // Build each list off-document and swap it in with one DOM update
         const localBranches = repo.local_branches || [];
-        for (const branch of localBranches) {
-            const item = document.createElement('div');
-            item.className = 'branch-item' + (branch === repo.branch ? ' current' : '');
-            item.textContent = branch;
-            item.addEventListener('click', () => selectBranch(branch, item, localList, remoteList));
-            localList.appendChild(item);
-        }
+        const localSet = new Set(localBranches);
+        localList.replaceChildren(buildBranchItems(localBranches, repo.branch));
 
-        // Populate remote branches (exclude those already local)
-        const remoteBranches = (repo.remote_branches || []).filter(b => !localBranches.includes(b));
-        for (const branch of remoteBranches) {
-            const item = document.createElement('div');
-            item.className = 'branch-item';
-            item.textContent = branch;
-            item.addEventListener('click', () => selectBranch(branch, item, localList, remoteList));
-            remoteList.appendChild(item);
-        }
+        // Remote branches, excluding those already local
+        const remoteBranches = (repo.remote_branches || []).filter(b => !localSet.has(b));
+        remoteList.replaceChildren(buildBranchItems(remoteBranches, null));
 
         branchModal.classList.remove('hidden');
     }
 
-    function selectBranch(branch, item, localList, remoteList) {
-        // Deselect all
-        for (const el of localList.querySelectorAll('.branch-item')) {
-            el.classList.remove('selected');
-        }
-        for (const el of remoteList.querySelectorAll('.branch-item')) {
-            el.classList.remove('selected');
+    function buildBranchItems(branches, currentBranch) {
+        const fragment = document.createDocumentFragment();
+        for (const branch of branches) {
+            const item = document.createElement('div');
+            item.className = 'branch-item' + (branch === currentBranch ? ' current' : '');
+            item.textContent = branch;
+            item.addEventListener('click', () => selectBranch(branch, item));
+            fragment.appendChild(item);
         }
+        return fragment;
+    }
+
+    function selectBranch(branch, item) {
+        // Deselect the previous choice
+        if (selectedItem) selectedItem.classList.remove('selected');
 
         // Select this one
         item.classList.add('selected');
+        selectedItem = item;
         selectedBranch = branch;
         document.getElementById('btn-checkout').disabled = false;
     }
@@ -152,14 +144,23 @@ const Actions = (() => {
     function doCheckout() {
         if (!currentCheckoutRepo || !selectedBranch) return;
         branchModal.classList.add('hidden');
+        // A checkout also changes the parent's submodule pointer, so reload
+        // everything rather than just the checked-out repo.
         postAction('/api/action/checkout', {
             path: currentCheckoutRepo.path,
             branch: selectedBranch,
-        });
+        }, true);
     }
 
-    async function postAction(url, body) {
+    /**
+     * POST a git action, then refresh the view.
+     *
+     * The server re-validates the repos an action touched, so `reload`
+     * (full rediscovery) is only needed when other repos may be affected.
+     */
+    async function postAction(url, body, reload) {
         App.setStatus(`Working...`);
+        let repo = null;
 
         try {
             const response = await fetch(url, {
@@ -168,6 +169,7 @@ const Actions = (() => {
                 body: JSON.stringify(body),
             });
             const result = await response.json();
+            repo = result.repo || null;
 
             if (result.ok) {
                 App.setStatus(result.error || 'Done');
@@ -179,7 +181,7 @@ const Actions = (() => {
         }
 
         // Always refresh after an action
-        if (onActionComplete) onActionComplete();
+        if (onActionComplete) onActionComplete({ reload, repo });
     }
 
     return {
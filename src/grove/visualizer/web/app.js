@@ -22,7 +22,7 @@ const App = (() => {
         });
 
         // Toolbar buttons
-        document.getElementById('btn-refresh').addEventListener('click', refresh);
+        document.getElementById('btn-refresh').addEventListener('click', () => refresh());
         document.getElementById('btn-zoom-fit').addEventListener('click', () => Graph.zoomToFit());
         document.getElementById('btn-zoom-in').addEventListener('click', () => Graph.zoomIn());
         document.getElementById('btn-zoom-out').addEventListener('click', () => Graph.zoomOut());
@@ -46,7 +46,9 @@ const App = (() => {
         setStatus('Loading repositories...');
 
         try {
-            const response = await fetch('/api/repos');
+            // Accept the last known state so the page can draw while the
+            // server is still loading.
+            const response = await fetch('/api/repos?allow_stale=1');
             const data = await response.json();
 
             if (data.repos) {
@@ -61,7 +63,14 @@ const App = (() => {
                 // Zoom to fit on initial load
                 requestAnimationFrame(() => Graph.zoomToFit());
 
-                setStatus(`Loaded ${data.repos.length} repositories`);
+                if (data.stale) {
+                    // Last known state from a previous run; the follow-up
+                    // request waits for the server to finish loading.
+                    setStatus('Loading repositories (showing last known state)...');
+                    refresh({ reload: false });
+                } else {
+                    setStatus(`Loaded ${data.repos.length} repositories`);
+                }
             } else {
                 setStatus('No repositories found');
             }
@@ -73,12 +82,47 @@ const App = (() => {
         Worktree.loadWorktrees();
     }
 
-    async function refresh() {
+    // Refreshes requested while one is in flight (e.g. several actions
+    // finishing back to back) are merged into a single follow-up run.
+    let refreshing = false;
+    let queuedRefresh = null;
+
+    async function refresh(options = {}) {
+        const reload = options.reload !== false;
+        if (options.repo && !reload) {
+            // Per-repo actions return the updated repo; patch just that node.
+            // A refresh already in flight may have read the old state, so
+            // still queue a follow-up in that case.
+            Graph.updateRepo(options.repo);
+            if (!refreshing) return;
+        }
+        if (refreshing) {
+            queuedRefresh = { reload: reload || (queuedRefresh !== null && queuedRefresh.reload) };
+            return;
+        }
+
+        refreshing = true;
+        try {
+            await doRefresh(reload);
+        } finally {
+            refreshing = false;
+        }
+
+        if (queuedRefresh) {
+            const next = queuedRefresh;
+            queuedRefresh = null;
+            refresh(next);
+        }
+    }
+
+    async function doRefresh(reload) {
         setStatus('Refreshing...');
 
         try {
-            // Tell server to reload
-            await fetch('/api/action/refresh', { method: 'POST' });
+            // Tell server to rediscover and revalidate every repo
+            if (reload) {
+                await fetch('/api/action/refresh', { method: 'POST' });
+            }
 
             // Fetch fresh data
             const response = await fetch('/api/repos');
@@ -104,15 +148,13 @@ const App = (() => {
             return;
         }
 
-        // Clear existing content
-        while (panel.firstChild) {
-            panel.removeChild(panel.firstChild);
-        }
+        // Build off-document, then swap in with a single DOM update
+        const content = document.createDocumentFragment();
 
         const name = document.createElement('div');
         name.className = 'detail-name';
         name.textContent = repo.name;
-        panel.appendChild(name);
+        content.appendChild(name);
 
         const info = document.createElement('div');
         const details = [
@@ -131,14 +173,14 @@ const App = (() => {
             span.textContent = detail;
             info.appendChild(span);
         }
-        panel.appendChild(info);
+        content.appendChild(info);
 
         // Commit message
         if (repo.commit_message) {
             const msg = document.createElement('div');
             msg.className = 'detail-commit-message';
             msg.textContent = repo.commit_message;
-            panel.appendChild(msg);
+            content.appendChild(msg);
         }
 
         // Changed files (only shown when uncommitted)
@@ -160,8 +202,10 @@ const App = (() => {
                 list.appendChild(row);
             }
             section.appendChild(list);
-            panel.appendChild(section);
+            content.appendChild(section);
         }
+
+        panel.replaceChildren(content);
     }
 
     function setStatus(message) {
@@ -40,6 +40,8 @@ const Graph = (() => {
     let collapsedPaths = new Set();
     let currentRepos = [];
     let layoutResult = null;
+    // Drawn nodes by repo path: { layout, element }
+    let drawnNodes = new Map();
 
     const CORNER_RADIUS = 6;
     const HEADER_HEIGHT = 26;
@@ -62,11 +64,35 @@ const Graph = (() => {
         window.addEventListener('mousemove', onMouseMove);
         window.addEventListener('mouseup', onMouseUp);
 
+        // Node clicks are handled once here rather than per node: the
+        // clicked node is found with closest() and looked up by path.
+        group.addEventListener('click', (e) => {
+            const node = nodeForEvent(e);
+            if (!node) return;
+            e.stopPropagation();
+            if (e.target.closest('.collapse-toggle')) {
+                toggleCollapse(node.layout.repo.rel_path);
+            } else {
+                selectRepo(node.layout.repo);
+            }
+        });
+
+        group.addEventListener('contextmenu', (e) => {
+            const node = nodeForEvent(e);
+            if (!node) return;
+            e.preventDefault();
+            e.stopPropagation();
+            const repo = node.layout.repo;
+            selectRepo(repo);
+            if (onRightClickCallback) onRightClickCallback(repo, e.clientX, e.clientY);
+        });
+
         // Click away to deselect
         svg.addEventListener('click', (e) => {
             if (e.target === svg || e.target.closest('#graph-group') === group && !e.target.closest('.node-group')) {
+                const previous = selectedPath;
                 selectedPath = null;
-                render();
+                redrawNode(previous);
                 if (onSelectCallback) onSelectCallback(null);
             }
         });
@@ -91,36 +117,92 @@ const Graph = (() => {
 
     function render() {
         clearElement(group);
+        drawnNodes = new Map();
 
         if (!layoutResult || !layoutResult.root) return;
 
-        // Draw edges first
-        drawEdges(layoutResult.root);
+        // Single walk: every edge goes into one <path> and the nodes are
+        // built off-document. Edges are appended first so they stay below.
+        const nodes = document.createDocumentFragment();
+        const edgeData = [];
+        const pending = [layoutResult.root];
+        while (pending.length > 0) {
+            const layout = pending.pop();
+            const element = createNode(layout);
+            drawnNodes.set(layout.repo.path, { layout, element });
+            nodes.appendChild(element);
+            for (const child of layout.children) {
+                edgeData.push(edgePath(layout, child));
+            }
+            // Reversed so nodes are emitted in pre-order
+            for (let i = layout.children.length - 1; i >= 0; i--) {
+                pending.push(layout.children[i]);
+            }
+        }
 
-        // Draw nodes
-        drawNodes(layoutResult.root);
+        if (edgeData.length > 0) {
+            const edges = document.createElementNS('http://www.w3.org/2000/svg', 'path');
+            edges.setAttribute('d', edgeData.join(' '));
+            edges.setAttribute('class', 'edge-path');
+            group.appendChild(edges);
+        }
+        group.appendChild(nodes);
 
         applyTransform();
     }
 
-    function drawEdges(layout) {
-        for (const child of layout.children) {
-            const x1 = layout.x;
-            const y1 = layout.y + layout.height;
-            const x2 = child.x;
-            const y2 = child.y;
-            const cy = (y1 + y2) / 2;
+    function edgePath(parent, child) {
+        const x1 = parent.x;
+        const y1 = parent.y + parent.height;
+        const x2 = child.x;
+        const y2 = child.y;
+        const cy = (y1 + y2) / 2;
+        return `M ${x1} ${y1} C ${x1} ${cy}, ${x2} ${cy}, ${x2} ${y2}`;
+    }
+
+    /**
+     * Redraw a single repo's node in place.
+     *
+     * Node geometry does not depend on repo data, so a status change
+     * after a per-repo fetch/push needs neither a re-layout nor a full
+     * redraw.
+     */
+    function updateRepo(repo) {
+        const index = currentRepos.findIndex((r) => r.path === repo.path);
+        if (index === -1) return;
+        currentRepos[index] = repo;
+
+        const node = drawnNodes.get(repo.path);
+        if (!node) return;  // hidden inside a collapsed subtree
+        node.layout.repo = repo;
+        redrawNode(repo.path);
+
+        if (repo.path === selectedPath && onSelectCallback) onSelectCallback(repo);
+    }
 
-            const path = document.createElementNS('http://www.w3.org/2000/svg', 'path');
-            path.setAttribute('d', `M ${x1} ${y1} C ${x1} ${cy}, ${x2} ${cy}, ${x2} ${y2}`);
-            path.setAttribute('class', 'edge-path');
-            group.appendChild(path);
+    function redrawNode(path) {
+        const node = drawnNodes.get(path);
+        if (!node) return;
+        const element = createNode(node.layout);
+        group.replaceChild(element, node.element);
+        node.element = element;
+    }
 
-            drawEdges(child);
-        }
+    function nodeForEvent(e) {
+        const element = e.target.closest('.node-group');
+        return element ? drawnNodes.get(element.getAttribute('data-path')) : null;
+    }
+
+    /** Select *repo*; only the old and new selection change appearance. */
+    function selectRepo(repo) {
+        const previous = selectedPath;
+        selectedPath = repo.path;
+        if (previous !== repo.path) redrawNode(previous);
+        redrawNode(repo.path);
+        if (onSelectCallback) onSelectCallback(repo);
     }
 
-    function drawNodes(layout) {
+    function createNode(layout) {
         const repo = layout.repo;
         const w = layout.width;
         const h = layout.height;
@@ -216,10 +298,6 @@ const Graph = (() => {
             const toggleText = layout.isCollapsed ? `+ (${layout.childCount})` : '\u2212';
             const toggle = createText(layout.x, top + h + 12, toggleText, 'collapse-toggle');
             toggle.setAttribute('text-anchor', 'middle');
-            toggle.addEventListener('click', (e) => {
-                e.stopPropagation();
-                toggleCollapse(repo.rel_path);
-            });
             g.appendChild(toggle);
         }
 
@@ -232,31 +310,7 @@ const Graph = (() => {
             g.appendChild(sgText);
         }
 
-        // Event handlers
-        g.addEventListener('click', (e) => {
-            e.stopPropagation();
-            selectedPath = repo.path;
-            layoutResult = Layout.calculate(currentRepos, collapsedPaths);
-            render();
-            if (onSelectCallback) onSelectCallback(repo);
-        });
-
-        g.addEventListener('contextmenu', (e) => {
-            e.preventDefault();
-            e.stopPropagation();
-            selectedPath = repo.path;
-            layoutResult = Layout.calculate(currentRepos, collapsedPaths);
-            render();
-            if (onSelectCallback) onSelectCallback(repo);
-            if (onRightClickCallback) onRightClickCallback(repo, e.clientX, e.clientY);
-        });
-
-        group.appendChild(g);
-
-        // Recurse children
-        for (const child of layout.children) {
-            drawNodes(child);
-        }
+        return g;
     }
 
     function toggleCollapse(relPath) {
@@ -380,6 +434,7 @@ const Graph = (() => {
     return {
         init,
         setRepos,
+        updateRepo,
         render,
         zoomToFit,
         zoomIn,
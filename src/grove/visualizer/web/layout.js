@@ -47,107 +47,113 @@ const Layout = (() => {
             childrenMap[key].sort((a, b) => a.name.localeCompare(b.name));
         }
 
-        // Recursively compute layout
-        const rootLayout = layoutSubtree(root, childrenMap, 0, collapsedPaths);
+        // Compute layout
+        const { rootLayout, maxDepth } = layoutTree(root, childrenMap, collapsedPaths);
 
-        // Get bounds
-        const bounds = getBounds(rootLayout);
+        // Every subtree is centered on its root, so the tree spans the
+        // root's subtree width; place it so it starts at PADDING.
+        rootLayout.x = PADDING + rootLayout.subtreeWidth / 2;
+        placeChildren(rootLayout);
 
-        // Shift so the tree starts at PADDING
-        shiftSubtree(rootLayout, PADDING - bounds.minX, PADDING);
-
-        const totalWidth = (bounds.maxX - bounds.minX) + 2 * PADDING;
-        const totalHeight = bounds.maxY + 2 * PADDING;
+        const totalWidth = rootLayout.subtreeWidth + 2 * PADDING;
+        const totalHeight = maxDepth * (NODE_HEIGHT + V_GAP) + NODE_HEIGHT + 2 * PADDING;
 
         return { root: rootLayout, width: totalWidth, height: totalHeight };
     }
 
-    function layoutSubtree(repo, childrenMap, depth, collapsedPaths) {
-        const isCollapsed = collapsedPaths.has(repo.rel_path);
-        const children = childrenMap[repo.path] || [];
+    /**
+     * Build the layout tree in an iterative post-order pass.
+     *
+     * Each node is built after its children and records every child's x
+     * offset from its own center; placeChildren() later turns the offsets
+     * into positions, so no subtree is ever moved after it is built.
+     */
+    function layoutTree(root, childrenMap, collapsedPaths) {
+        const stack = [visitFrame(root, 0, childrenMap, collapsedPaths)];
+        let rootLayout = null;
+        let maxDepth = 0;
+
+        while (stack.length > 0) {
+            const frame = stack[stack.length - 1];
+            if (frame.next < frame.visibleChildren.length) {
+                const child = frame.visibleChildren[frame.next++];
+                stack.push(visitFrame(child, frame.depth + 1, childrenMap, collapsedPaths));
+                continue;
+            }
 
-        // Layout children (unless collapsed)
-        const childLayouts = [];
-        if (!isCollapsed) {
-            for (const child of children) {
-                childLayouts.push(layoutSubtree(child, childrenMap, depth + 1, collapsedPaths));
+            stack.pop();
+            maxDepth = Math.max(maxDepth, frame.depth);
+            const layout = buildLayout(frame);
+            if (stack.length > 0) {
+                stack[stack.length - 1].childLayouts.push(layout);
+            } else {
+                rootLayout = layout;
             }
         }
 
-        const y = depth * (NODE_HEIGHT + V_GAP);
-
-        if (childLayouts.length === 0) {
-            return {
-                repo,
-                x: 0, y,
-                width: NODE_WIDTH,
-                height: NODE_HEIGHT,
-                children: [],
-                childCount: children.length,
-                isCollapsed,
-            };
-        }
+        return { rootLayout, maxDepth };
+    }
 
-        // Total width of children subtrees
-        let totalChildrenWidth = 0;
-        for (const cl of childLayouts) {
-            totalChildrenWidth += subtreeWidth(cl);
-        }
-        totalChildrenWidth += H_GAP * (childLayouts.length - 1);
-
-        // Position children
-        let currentX = -totalChildrenWidth / 2;
-        for (const cl of childLayouts) {
-            const sw = subtreeWidth(cl);
-            const centerX = currentX + sw / 2;
-            shiftSubtree(cl, centerX - cl.x, 0);
-            currentX += sw + H_GAP;
+    /** Set absolute x positions below a placed node in one pre-order walk. */
+    function placeChildren(placed) {
+        const pending = [placed];
+        while (pending.length > 0) {
+            const layout = pending.pop();
+            for (const child of layout.children) {
+                child.x = layout.x + child.offsetX;
+                pending.push(child);
+            }
         }
+    }
 
+    function visitFrame(repo, depth, childrenMap, collapsedPaths) {
+        const isCollapsed = collapsedPaths.has(repo.rel_path);
+        const children = childrenMap[repo.path] || [];
         return {
             repo,
-            x: 0, y,
-            width: NODE_WIDTH,
-            height: NODE_HEIGHT,
-            children: childLayouts,
-            childCount: children.length,
+            depth,
             isCollapsed,
+            childCount: children.length,
+            // Children of a collapsed node are not laid out
+            visibleChildren: isCollapsed ? [] : children,
+            next: 0,
+            childLayouts: [],
         };
     }
 
-    function subtreeWidth(layout) {
-        if (layout.children.length === 0) {
-            return NODE_WIDTH;
-        }
-        let total = 0;
-        for (const c of layout.children) {
-            total += subtreeWidth(c);
-        }
-        total += H_GAP * (layout.children.length - 1);
-        return Math.max(NODE_WIDTH, total);
-    }
-
-    function getBounds(layout) {
-        let minX = layout.x - layout.width / 2;
-        let maxX = layout.x + layout.width / 2;
-        let maxY = layout.y + layout.height;
+    function buildLayout(frame) {
+        const childLayouts = frame.childLayouts;
+        let subtreeWidth = NODE_WIDTH;
 
-        for (const child of layout.children) {
-            const cb = getBounds(child);
-            minX = Math.min(minX, cb.minX);
-            maxX = Math.max(maxX, cb.maxX);
-            maxY = Math.max(maxY, cb.maxY);
+        if (childLayouts.length > 0) {
+            // Total width of children subtrees (each computed when built)
+            let totalChildrenWidth = 0;
+            for (const cl of childLayouts) {
+                totalChildrenWidth += cl.subtreeWidth;
+            }
+            totalChildrenWidth += H_GAP * (childLayouts.length - 1);
+            subtreeWidth = Math.max(NODE_WIDTH, totalChildrenWidth);
+
+            // Position children relative to this node's center
+            let currentX = -totalChildrenWidth / 2;
+            for (const cl of childLayouts) {
+                cl.offsetX = currentX + cl.subtreeWidth / 2;
+                currentX += cl.subtreeWidth + H_GAP;
+            }
         }
 
-        return { minX, maxX, maxY };
-    }
-
-    function shiftSubtree(layout, dx, dy) {
-        layout.x += dx;
-        layout.y += dy;
-        for (const child of layout.children) {
-            shiftSubtree(child, dx, dy);
-        }
+        return {
+            repo: frame.repo,
+            x: 0,
+            y: PADDING + frame.depth * (NODE_HEIGHT + V_GAP),
+            offsetX: 0,
+            width: NODE_WIDTH,
+            height: NODE_HEIGHT,
+            subtreeWidth,
+            children: childLayouts,
+            childCount: frame.childCount,
+            isCollapsed: frame.isCollapsed,
+        };
     }
 
     return {
@@ -315,7 +315,7 @@ def _run_sync_propagation(
     # Add all instance paths to merged_child_rel_paths
     submodules = discover_sync_submodules(repo_root, group.url_match)
     for sub in submodules:
-        merged_child_rel_paths.add(str(sub.path.relative_to(repo_root)))
+        merged_child_rel_paths.add(sub.rel_path)
 
     return 0
 
@@ -378,8 +378,8 @@ def _merge_and_sync_groups(
                 state.pre_sync_heads[rel] = sha
 
         for sub in submodules:
-            rel = str(sub.path.relative_to(repo_root))
-            sha = sub.get_current_commit()
+            rel = sub.rel_path
+            sha = sub.current_commit or sub.get_current_commit()
             if sha and rel not in state.pre_sync_heads:
                 state.pre_sync_heads[rel] = sha
 
@@ -642,8 +642,10 @@ def _discover_merge_scope(
     cache = TopologyCache.for_repo(repo_root)
     cache.load()
     root_commit_result = run_git(repo_root, "rev-parse", "--short", "HEAD", check=False)
-    if root_commit_result.returncode == 0:
-        cache.record(root_commit_result.stdout.strip(), repos, repo_root)
+    # Rewriting the cache is only needed when this commit is new to it.
+    if root_commit_result.returncode == 0 and cache.record(
+        root_commit_result.stdout.strip(), repos, repo_root
+    ):
         cache.prune()
         cache.save()
 
@@ -781,7 +783,7 @@ def _predict_sync_group_conflicts_for_dry_run(
                 f"  {Colors.yellow('⚠')} sync group '{gname}' ({canon.rel_path}): "
                 f"conflicts expected in {', '.join(conflicts)}"
             )
-        instance_paths = [str(sub.path.relative_to(repo_root)) for sub in subs]
+        instance_paths = [sub.rel_path for sub in subs]
         print(f"    Would sync to: {', '.join(instance_paths)}")
     print()
 
@@ -1102,7 +1104,7 @@ def _collect_merged_child_paths(
         if not group:
             continue
         for sub in _disc_subs(repo_root, group.url_match):
-            merged_child_rel_paths.add(str(sub.path.relative_to(repo_root)))
+            merged_child_rel_paths.add(sub.rel_path)
 
     return merged_child_rel_paths
 
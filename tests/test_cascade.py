@@ -295,6 +295,21 @@ class TestCheckSyncGroupConsistency:
         output = capsys.readouterr().out
         assert "warning" in output.lower()
 
+    def test_reuses_discovered_commits(self, tmp_sync_group_multi_instance: Path):
+        """HEADs read during discovery should not be re-queried per instance."""
+        from grove.sync import SyncSubmodule
+
+        with patch.object(SyncSubmodule, "get_current_commit") as mock_head:
+            result = _check_sync_group_consistency(
+                "common",
+                tmp_sync_group_multi_instance,
+                "common_origin",
+                force=False,
+            )
+
+        assert result is True
+        mock_head.assert_not_called()
+
 
 class TestCascadeSyncGroupCheck:
     """Integration tests: sync-group check during cascade start."""
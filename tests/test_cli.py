@@ -149,6 +149,16 @@ class TestCliSyncSubcommand:
         assert args.dry_run is False
         assert args.no_push is False
         assert args.skip_checks is False
+        assert args.full_fetch is False
+
+    def test_parse_sync_full_fetch(self):
+        """'sync --full-fetch' should opt out of partial fetches."""
+        mock_run = MagicMock(return_value=0)
+        with patch("grove.sync.run", mock_run):
+            main(["sync", "--full-fetch"])
+
+        args = mock_run.call_args[0][0]
+        assert args.full_fetch is True
 
     def test_parse_sync_group_only(self):
         """'sync common' should set group='common' and commit=None."""
@@ -5,9 +5,17 @@ from __future__ import annotations
 import json
 import threading
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
 
-from grove.filelock import atomic_write_json, locked_open
+from grove.filelock import (
+    atomic_write_json,
+    dumps_json,
+    encode_json,
+    loads_json,
+    locked_open,
+)
 
 
 class TestLockedOpen:
@@ -99,6 +107,37 @@ class TestAtomicWriteJson:
         assert not any(f.endswith(".tmp") for f in files)
 
 
+SAMPLE_JSON = {"snapshots": [{"root_commit": "abc", "entries": [], "note": "naïve"}]}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request):
+    """Run the test once with orjson (when installed) and once with json."""
+    with patch("grove.filelock._load_orjson", return_value=None) as mock_load:
+        if request.param == "orjson":
+            mock_load.return_value = pytest.importorskip("orjson")
+        yield request.param
+
+
+@pytest.mark.usefixtures("json_backend")
+class TestJsonBackends:
+    def test_round_trip(self):
+        text = dumps_json(SAMPLE_JSON)
+        assert text.endswith("\n")
+        assert loads_json(text) == SAMPLE_JSON
+        assert json.loads(text) == SAMPLE_JSON
+
+    def test_encode_compact_bytes(self):
+        body = encode_json(SAMPLE_JSON)
+        assert isinstance(body, bytes)
+        assert b"\n" not in body
+        assert json.loads(body) == SAMPLE_JSON
+
+    def test_malformed_raises_json_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            loads_json('{"snapshots": [')
+
+
 class TestConcurrentTopologySave:
     """Two threads saving TopologyCache simultaneously should produce valid JSON."""
 
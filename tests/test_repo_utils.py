@@ -13,7 +13,9 @@ from grove.repo_utils import (
     find_repo_root,
     get_git_common_dir,
     get_git_worktree_dir,
+    map_concurrently,
     run_git,
+    topological_levels,
     topological_sort_repos,
 )
 
@@ -189,6 +191,37 @@ class TestTopologicalSort:
             assert index[common_path] < index[td_path]
 
 
+# ---------------------------------------------------------------------------
+# topological_levels
+# ---------------------------------------------------------------------------
+
+
+class TestTopologicalLevels:
+    def test_levels_bottom_up(self, tmp_submodule_tree: Path):
+        """Each level should only contain repos whose children came earlier."""
+        repos = discover_repos_from_gitmodules(tmp_submodule_tree)
+        levels = topological_levels(repos)
+
+        assert [[r.path for r in level] for level in levels] == [
+            [tmp_submodule_tree / "technical-docs" / "common"],
+            [tmp_submodule_tree / "technical-docs"],
+            [tmp_submodule_tree],
+        ]
+
+    def test_siblings_share_a_level(self, tmp_path: Path):
+        """Independent siblings should be grouped into the same level."""
+        root = RepoInfo(path=tmp_path, repo_root=tmp_path)
+        a = RepoInfo(path=tmp_path / "a", repo_root=tmp_path, parent=root)
+        b = RepoInfo(path=tmp_path / "b", repo_root=tmp_path, parent=root)
+
+        levels = topological_levels([root, b, a])
+
+        assert [[r.path for r in level] for level in levels] == [
+            [a.path, b.path],
+            [root.path],
+        ]
+
+
 # ---------------------------------------------------------------------------
 # RepoInfo.validate
 # ---------------------------------------------------------------------------
@@ -222,6 +255,37 @@ class TestValidate:
         assert result is False
         assert info.status == RepoStatus.NO_REMOTE
 
+    def test_reset_validation_allows_revalidate(self, tmp_git_repo: Path):
+        """After reset_validation(), validate() reflects the repo's current
+        state rather than the previous result."""
+        readme = tmp_git_repo / "README.md"
+        readme.write_text("modified content\n")
+        info = RepoInfo(path=tmp_git_repo, repo_root=tmp_git_repo)
+        assert info.validate() is False
+        assert info.error_message
+
+        run_git(tmp_git_repo, "checkout", "--", "README.md")
+        info.reset_validation()
+        assert info.status == RepoStatus.OK
+        assert info.error_message is None
+        assert info.validate(allow_no_remote=True) is True
+        assert info.status == RepoStatus.NO_REMOTE
+
+    def test_ahead_of_upstream(self, tmp_git_repo: Path, tmp_path: Path):
+        """Ahead/behind counts come from the configured upstream."""
+        remote = tmp_path / "remote.git"
+        run_git(tmp_path, "init", "--bare", str(remote))
+        run_git(tmp_git_repo, "remote", "add", "origin", str(remote))
+        run_git(tmp_git_repo, "push", "-u", "origin", "HEAD")
+        (tmp_git_repo / "extra.txt").write_text("extra\n")
+        run_git(tmp_git_repo, "add", "extra.txt")
+        run_git(tmp_git_repo, "commit", "-m", "Extra")
+
+        info = RepoInfo(path=tmp_git_repo, repo_root=tmp_git_repo)
+        assert info.validate(check_sync=True) is True
+        assert (info.ahead_count, info.behind_count) == ("1", "0")
+        assert info.status == RepoStatus.PENDING
+
 
 # ---------------------------------------------------------------------------
 # RepoInfo helper methods
@@ -316,6 +380,45 @@ class TestRepoInfoHelpers:
         info = RepoInfo(path=tmp_git_repo, repo_root=tmp_git_repo)
         assert info.get_commit_tag() is None
 
+    def test_get_branches(self, tmp_git_repo: Path):
+        run_git(tmp_git_repo, "branch", "feature")
+        run_git(tmp_git_repo, "update-ref", "refs/remotes/origin/main", "HEAD")
+        run_git(tmp_git_repo, "update-ref", "refs/remotes/upstream/topic", "HEAD")
+        run_git(
+            tmp_git_repo,
+            "symbolic-ref",
+            "refs/remotes/origin/HEAD",
+            "refs/remotes/origin/main",
+        )
+        info = RepoInfo(path=tmp_git_repo, repo_root=tmp_git_repo)
+
+        local, remote = info.get_branches()
+
+        assert "feature" in local
+        assert info.get_branch() in local
+        assert remote == ["main", "upstream/topic"]
+        assert info.get_local_branches() == local
+        assert info.get_remote_branches() == remote
+
+    def test_fetch_all_remotes(self, tmp_git_repo: Path, tmp_path: Path):
+        for name in ("origin", "mirror"):
+            remote = tmp_path / f"{name}.git"
+            run_git(tmp_git_repo, "clone", "--bare", str(tmp_git_repo), str(remote))
+            run_git(tmp_git_repo, "remote", "add", name, str(remote))
+        info = RepoInfo(path=tmp_git_repo, repo_root=tmp_git_repo)
+
+        assert info.fetch() is True
+        branch = info.get_branch()
+        assert {branch, f"mirror/{branch}"} <= set(info.get_remote_branches())
+
+    def test_quiet_push_failure_keeps_git_error(self, tmp_git_repo: Path):
+        run_git(tmp_git_repo, "remote", "add", "origin", "/nonexistent/remote.git")
+        info = RepoInfo(path=tmp_git_repo, repo_root=tmp_git_repo)
+        info.branch = info.get_branch()
+
+        assert info.push(quiet=True) is False
+        assert "/nonexistent/remote.git" in info.error_message
+
 
 # ---------------------------------------------------------------------------
 # find_repo_root
@@ -361,6 +464,13 @@ class TestFindRepoRoot:
         assert result == tmp_submodule_tree
 
 
+class TestMapConcurrently:
+    def test_preserves_input_order(self):
+        assert map_concurrently(lambda n: n * n, list(range(20))) == [
+            n * n for n in range(20)
+        ]
+
+
 class TestRunGit:
     def test_uses_dash_c_instead_of_cwd(self, tmp_git_repo: Path):
         """run_git should pass repository context with git -C."""
@@ -2,13 +2,41 @@
 
 import subprocess
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 
 from grove.config import SyncGroup
-from grove.repo_utils import parse_gitmodules
-from grove.sync import _sync_group, resolve_remote_url, resolve_target_commit
+from grove.repo_utils import RepoInfo, RepoStatus, parse_gitmodules
+from grove.sync import (
+    SyncSubmodule,
+    _clear_target_caches,
+    _collect_repos_to_push,
+    _commit_group_updates,
+    _display_group_discovery,
+    _fetch,
+    _fetch_parent_repos,
+    _iter_gitmodules_paths,
+    _push_group_repositories,
+    _submodules_needing_update,
+    _sync_group,
+    _update_group_submodules,
+    commit_submodule_changes,
+    discover_sync_submodules,
+    push_ahead_submodules,
+    resolve_local_tip,
+    resolve_remote_url,
+    resolve_target_commit,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_target_caches():
+    """Memoized remote targets must not leak between tests."""
+    _clear_target_caches()
+    yield
+    _clear_target_caches()
 
 
 class TestParseGitmodules:
@@ -86,6 +114,23 @@ class TestParseGitmodules:
         results = parse_gitmodules(gitmodules)
         assert results == []
 
+    def test_rewritten_file_is_reparsed(self, tmp_path: Path):
+        """Memoized parsing must still reflect the file's current content."""
+        gitmodules = tmp_path / ".gitmodules"
+        gitmodules.write_text('[submodule "a"]\n    path = a\n    url = u/a\n')
+        assert [r[1] for r in parse_gitmodules(gitmodules)] == ["a"]
+
+        gitmodules.write_text('[submodule "b"]\n    path = b\n    url = u/b\n')
+        assert [r[1] for r in parse_gitmodules(gitmodules)] == ["b"]
+
+    def test_returned_list_is_not_shared(self, tmp_path: Path):
+        """Mutating one result must not leak into later memoized calls."""
+        gitmodules = tmp_path / ".gitmodules"
+        gitmodules.write_text('[submodule "a"]\n    path = a\n    url = u/a\n')
+        parse_gitmodules(gitmodules).append(("x", "x", "x"))
+
+        assert [r[1] for r in parse_gitmodules(gitmodules)] == ["a"]
+
     def test_returns_name_path_url_tuples(self, tmp_path: Path):
         """Each entry should be a (name, path, url) tuple."""
         gitmodules = tmp_path / ".gitmodules"
@@ -158,6 +203,20 @@ class TestResolveTargetCommit:
         assert "example.com" in source
         mock_run.assert_called_once()
 
+    def test_ls_remote_memoized_per_url(self):
+        """Resolving the same remote twice should only run ls-remote once."""
+        fake_output = f"{'b' * 40}\tHEAD\n"
+
+        with patch("grove.sync.subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(
+                args=[], returncode=0, stdout=fake_output, stderr=""
+            )
+            first = resolve_target_commit(None, None, remote_url="https://x/r.git")
+            second = resolve_target_commit(None, None, remote_url="https://x/r.git")
+
+        assert first == second
+        mock_run.assert_called_once()
+
     def test_ls_remote_failure_raises(self):
         """When git ls-remote fails, should raise ValueError."""
         with patch("grove.sync.subprocess.run") as mock_run:
@@ -233,6 +292,81 @@ def _git(cwd: Path, *args: str) -> subprocess.CompletedProcess:
     )
 
 
+class TestResolveLocalTip:
+    def test_picks_instance_with_local_commits(
+        self, tmp_sync_group_multi_instance: Path
+    ):
+        """Only the advanced instance holds every commit; it should be the tip."""
+        root = tmp_sync_group_multi_instance
+        common = root / "backend" / "libs" / "common"
+        (common / "ahead.py").write_text("# ahead\n")
+        _git(common, "add", "ahead.py")
+        _git(common, "commit", "-m", "Ahead")
+        head = _git(common, "rev-parse", "HEAD").stdout.strip()
+
+        submodules = discover_sync_submodules(root, "common_origin")
+        tip = resolve_local_tip(submodules)
+
+        assert tip is not None
+        assert tip[:2] == (head, common)
+
+    def test_diverged_returns_none(self, tmp_sync_group_diverged: Path):
+        root = tmp_sync_group_diverged
+        submodules = discover_sync_submodules(root, "common_origin")
+        assert resolve_local_tip(submodules) is None
+
+
+class TestDiscoverSyncSubmodules:
+    def test_current_commit_matches_head(self, tmp_sync_group_multi_instance: Path):
+        """Batched discovery should report each instance's checked-out HEAD."""
+        root = tmp_sync_group_multi_instance
+        submodules = discover_sync_submodules(root, "common_origin")
+
+        assert len(submodules) == 3
+        for sub in submodules:
+            head = _git(sub.path, "rev-parse", "HEAD").stdout.strip()
+            assert sub.current_commit == head
+
+    def test_reuses_supplied_gitmodules_paths(
+        self, tmp_sync_group_multi_instance: Path
+    ):
+        """A pre-walked file list should be used instead of walking again."""
+        root = tmp_sync_group_multi_instance
+        paths = list(_iter_gitmodules_paths(root))
+
+        with patch("grove.sync._iter_gitmodules_paths") as mock_walk:
+            submodules = discover_sync_submodules(root, "common_origin", paths)
+
+        mock_walk.assert_not_called()
+        assert len(submodules) == 3
+
+    def test_rel_path_relative_to_root(self, tmp_sync_group_multi_instance: Path):
+        root = tmp_sync_group_multi_instance
+        submodules = discover_sync_submodules(root, "common_origin")
+
+        assert sorted(s.rel_path for s in submodules) == [
+            "backend/libs/common",
+            "frontend/libs/common",
+            "shared/libs/common",
+        ]
+
+    def test_current_commit_follows_moved_head(
+        self, tmp_sync_group_multi_instance: Path
+    ):
+        """An instance whose HEAD moved past the parent's gitlink is still read."""
+        root = tmp_sync_group_multi_instance
+        common = root / "frontend" / "libs" / "common"
+        (common / "extra.py").write_text("# extra\n")
+        _git(common, "add", "extra.py")
+        _git(common, "commit", "-m", "Local commit")
+        head = _git(common, "rev-parse", "HEAD").stdout.strip()
+
+        submodules = discover_sync_submodules(root, "common_origin")
+
+        by_path = {s.path: s for s in submodules}
+        assert by_path[common].current_commit == head
+
+
 class TestSyncParentPointerPropagation:
     def test_sync_propagates_child_pointer_updates_to_parent(
         self,
@@ -274,6 +408,103 @@ class TestSyncParentPointerPropagation:
         )
 
 
+class TestDisplayGroupDiscovery:
+    def test_lists_each_location(self, tmp_path: Path, capsys):
+        target = "a" * 40
+        subs = [
+            SyncSubmodule(
+                path=tmp_path / name,
+                parent_repo=tmp_path,
+                submodule_rel_path=name,
+                current_commit=sha,
+                rel_path=name,
+            )
+            for name, sha in [("done", target), ("stale", "b" * 40), ("pin", None)]
+        ]
+
+        _display_group_discovery(False, target, subs, {"pin"})
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "3" in lines[0]
+        assert "done (already at aaaaaaa)" in lines[1]
+        assert "stale (bbbbbbb → aaaaaaa)" in lines[2]
+        assert "pin (unknown)" in lines[3]
+        assert lines[4] == ""
+
+
+class TestSyncAlreadyAtTarget:
+    def test_skips_parent_validation(self, tmp_sync_group_multi_instance: Path):
+        """A no-op sync should return before fetching or validating parents."""
+        root = tmp_sync_group_multi_instance
+        head = _git(root / "frontend" / "libs" / "common", "rev-parse", "HEAD")
+        group = SyncGroup(name="common", url_match="common_origin")
+
+        with patch("grove.sync._validate_parent_repositories") as mock_validate:
+            result = _sync_group(
+                group,
+                root,
+                commit_arg=head.stdout.strip(),
+                dry_run=False,
+                no_push=True,
+                force=False,
+                quiet=True,
+            )
+
+        assert result == 0
+        mock_validate.assert_not_called()
+
+    def test_validates_only_instances_that_move(
+        self, tmp_sync_group_multi_instance: Path
+    ):
+        """Parents of instances already at the target are left alone."""
+        root = tmp_sync_group_multi_instance
+        frontend_common = root / "frontend" / "libs" / "common"
+        _git(frontend_common, "commit", "--allow-empty", "-m", "Advance")
+        head = _git(frontend_common, "rev-parse", "HEAD").stdout.strip()
+        group = SyncGroup(name="common", url_match="common_origin")
+
+        with patch(
+            "grove.sync._validate_parent_repositories", return_value=(1, [])
+        ) as mock_validate:
+            _sync_group(
+                group,
+                root,
+                commit_arg=head,
+                dry_run=True,
+                no_push=True,
+                force=False,
+                quiet=True,
+            )
+
+        validated = {s.rel_path for s in mock_validate.call_args.args[0]}
+        assert validated == {"backend/libs/common", "shared/libs/common"}
+
+
+class TestSubmodulesNeedingUpdate:
+    def _sub(self, commit):
+        return SyncSubmodule(
+            path=Path("/x"),
+            parent_repo=Path("/"),
+            submodule_rel_path="x",
+            current_commit=commit,
+        )
+
+    def test_shared_short_prefix_still_needs_update(self):
+        target = "abcdef1" + "0" * 33
+        sub = self._sub("abcdef1" + "f" * 33)
+        assert _submodules_needing_update([sub], target) == [sub]
+
+    def test_matches_full_and_abbreviated_target(self):
+        commit = "abcdef1" + "0" * 33
+        sub = self._sub(commit)
+        assert _submodules_needing_update([sub], commit) == []
+        assert _submodules_needing_update([sub], commit[:9]) == []
+
+    def test_unknown_commit_needs_update(self):
+        sub = self._sub(None)
+        assert _submodules_needing_update([sub], "a" * 40) == [sub]
+
+
 class TestSyncRemoteResolution:
     def test_remote_sync_uses_nested_remote_url(
         self,
@@ -312,3 +543,382 @@ class TestSyncRemoteResolution:
             None,
             remote_url=str(common_origin),
         )
+
+
+class TestPushGroupRepositories:
+    def _repo(self, tmp_path: Path, name: str, parent=None) -> RepoInfo:
+        repo = RepoInfo(path=tmp_path / name, repo_root=tmp_path, parent=parent)
+        repo.branch = "main"
+        repo.ahead_count = "1"
+        return repo
+
+    def test_pushes_siblings_and_parent(self, tmp_path: Path):
+        """All levels should be pushed when every push succeeds."""
+        root = self._repo(tmp_path, ".")
+        a = self._repo(tmp_path, "a", parent=root)
+        b = self._repo(tmp_path, "b", parent=root)
+
+        with patch.object(RepoInfo, "push", return_value=True) as mock_push:
+            push_failed, pushed = _push_group_repositories(
+                [root, a, b], dry_run=False, quiet=True
+            )
+
+        assert (push_failed, pushed) == (False, 3)
+        assert mock_push.call_count == 3
+
+    def test_failure_skips_parent_level(self, tmp_path: Path, capsys):
+        """A failed child push should stop parents from being pushed."""
+        root = self._repo(tmp_path, ".")
+        a = self._repo(tmp_path, "a", parent=root)
+        b = self._repo(tmp_path, "b", parent=root)
+        pushed_paths = []
+
+        def fake_push(self, dry_run=False, quiet=False):
+            pushed_paths.append(self.path)
+            return self.path != a.path
+
+        with patch.object(RepoInfo, "push", fake_push):
+            push_failed, pushed = _push_group_repositories(
+                [root, a, b], dry_run=False, quiet=True
+            )
+
+        assert (push_failed, pushed) == (True, 1)
+        assert root.path not in pushed_paths
+        assert "Skipped 1 parent" in capsys.readouterr().out
+
+    def test_failure_reason_shown_for_concurrent_push(self, tmp_path: Path, capsys):
+        root = self._repo(tmp_path, ".")
+        a = self._repo(tmp_path, "a", parent=root)
+        b = self._repo(tmp_path, "b", parent=root)
+
+        def fake_push(self, dry_run=False, quiet=False):
+            if self.path == a.path:
+                self.error_message = "! [rejected] main -> main (non-fast-forward)"
+                return False
+            return True
+
+        with patch.object(RepoInfo, "push", fake_push):
+            _push_group_repositories([root, a, b], dry_run=False, quiet=True)
+
+        assert "(non-fast-forward)" in capsys.readouterr().out
+
+
+class TestCollectReposToPush:
+    def _repo(self, tmp_path: Path, name: str, ahead: str, status) -> RepoInfo:
+        repo = RepoInfo(path=tmp_path / name, repo_root=tmp_path)
+        repo.ahead_count = ahead
+        repo.status = status
+        return repo
+
+    def test_bumps_ahead_count_without_revalidating(self, tmp_path: Path):
+        clean = self._repo(tmp_path, "clean", "0", RepoStatus.UP_TO_DATE)
+        ahead = self._repo(tmp_path, "ahead", "2", RepoStatus.PENDING)
+        idle = self._repo(tmp_path, "idle", "0", RepoStatus.UP_TO_DATE)
+
+        with patch.object(RepoInfo, "validate") as mock_validate:
+            repos = _collect_repos_to_push([clean, ahead, idle], [clean, ahead])
+
+        mock_validate.assert_not_called()
+        assert repos == [clean, ahead]
+        assert (clean.ahead_count, ahead.ahead_count) == ("1", "3")
+        assert clean.status == RepoStatus.PENDING
+
+    def test_revalidates_repos_that_failed_validation(self, tmp_path: Path):
+        """Repos we pushed past with --skip-checks get a fresh validation."""
+        behind = self._repo(tmp_path, "behind", "1", RepoStatus.BEHIND)
+
+        def fake_validate(self, **kwargs):
+            self.ahead_count = "1"
+            self.status = RepoStatus.PENDING
+            return True
+
+        with patch.object(RepoInfo, "validate", fake_validate):
+            repos = _collect_repos_to_push([behind], [])
+
+        assert repos == [behind]
+
+
+class TestCommitSubmoduleChanges:
+    def _advance(self, sub: Path) -> None:
+        (sub / "new.txt").write_text("new\n")
+        _git(sub, "add", "new.txt")
+        _git(sub, "commit", "-m", "Advance")
+
+    def test_no_changes_returns_false(self, tmp_sibling_submodules: Path):
+        root = RepoInfo(path=tmp_sibling_submodules, repo_root=tmp_sibling_submodules)
+        assert not commit_submodule_changes(root, ["docs-a", "docs-b"], "Sync")
+
+    def test_commits_all_changed_paths_together(self, tmp_sibling_submodules: Path):
+        """Every changed submodule pointer should land in a single commit."""
+        root_path = tmp_sibling_submodules
+        for name in ("docs-a", "docs-b"):
+            self._advance(root_path / name)
+        root = RepoInfo(path=root_path, repo_root=root_path)
+
+        assert commit_submodule_changes(root, ["docs-a", "docs-b"], "Sync")
+
+        changed = _git(root_path, "show", "--name-only", "--format=", "HEAD")
+        assert changed.stdout.split() == ["docs-a", "docs-b"]
+
+    def test_bad_path_raises(self, tmp_sibling_submodules: Path):
+        """A rejected batched add must not pass for 'nothing to commit'."""
+        root_path = tmp_sibling_submodules
+        self._advance(root_path / "docs-a")
+        root = RepoInfo(path=root_path, repo_root=root_path)
+
+        with pytest.raises(RuntimeError, match="git add failed"):
+            commit_submodule_changes(
+                root, ["docs-a", "missing"], "Sync", check_changes=False
+            )
+
+
+class TestGetCurrentCommit:
+    def _fake_pygit2(self, head=None):
+        class GitError(Exception):
+            pass
+
+        class Repository:
+            def __init__(self, path):
+                if head is None:
+                    raise GitError(path)
+                self.head = SimpleNamespace(target=head)
+
+        return SimpleNamespace(GitError=GitError, Repository=Repository)
+
+    def test_uses_pygit2_when_available(self, tmp_path: Path):
+        sub = SyncSubmodule(path=tmp_path, parent_repo=tmp_path, submodule_rel_path="x")
+
+        with (
+            patch("grove.sync._load_pygit2", return_value=self._fake_pygit2("c" * 40)),
+            patch("grove.sync.run_git") as mock_git,
+        ):
+            assert sub.get_current_commit() == "c" * 40
+
+        mock_git.assert_not_called()
+
+    def test_falls_back_to_git_cli(self, tmp_git_repo: Path):
+        sub = SyncSubmodule(
+            path=tmp_git_repo, parent_repo=tmp_git_repo, submodule_rel_path="x"
+        )
+        head = _git(tmp_git_repo, "rev-parse", "HEAD").stdout.strip()
+
+        with patch("grove.sync._load_pygit2", return_value=self._fake_pygit2()):
+            assert sub.get_current_commit() == head
+
+
+class TestUpdateToCommit:
+    def test_skips_fetch_when_commit_present(self, tmp_sync_group_diverged: Path):
+        """A target already in the object store should be checked out offline."""
+        root = tmp_sync_group_diverged
+        common = root / "frontend" / "libs" / "common"
+        target = _git(common, "rev-parse", "HEAD~1").stdout.strip()
+        sub = SyncSubmodule(
+            path=common,
+            parent_repo=common.parent.parent,
+            submodule_rel_path="libs/common",
+        )
+
+        with patch("grove.sync._fetch") as mock_fetch:
+            assert sub.update_to_commit(target)
+
+        mock_fetch.assert_not_called()
+        assert _git(common, "rev-parse", "HEAD").stdout.strip() == target
+
+    def test_fetches_missing_commit(self, tmp_path: Path):
+        sub = SyncSubmodule(path=tmp_path, parent_repo=tmp_path, submodule_rel_path="x")
+        missing = subprocess.CompletedProcess(args=[], returncode=128)
+        ok = subprocess.CompletedProcess(args=[], returncode=0)
+
+        with (
+            patch("grove.sync.run_git", side_effect=[missing, ok]) as mock_git,
+            patch("grove.sync._fetch") as mock_fetch,
+        ):
+            assert sub.update_to_commit("a" * 40)
+
+        mock_fetch.assert_called_once_with(sub, "--all", "--quiet", full=False)
+        assert mock_git.call_args.args[1] == "checkout"
+
+
+class TestUpdateGroupSubmodules:
+    def test_fetches_remote_once_per_group(self, tmp_sync_group_multi_instance: Path):
+        """Later instances should copy the target from an updated peer."""
+        root = tmp_sync_group_multi_instance
+        common_origin = root.parent / "common_origin"
+        (common_origin / "new.py").write_text("# new\n")
+        _git(common_origin, "add", "new.py")
+        _git(common_origin, "commit", "-m", "New")
+        target = _git(common_origin, "rev-parse", "HEAD").stdout.strip()
+        submodules = discover_sync_submodules(root, "common_origin")
+
+        with patch("grove.sync._fetch", wraps=_fetch) as mock_fetch:
+            updated = _update_group_submodules(
+                submodules, "common", target, False, True, None
+            )
+
+        assert len(updated) == 3
+        assert mock_fetch.call_count == 1
+        for sub in submodules:
+            assert _git(sub.path, "rev-parse", "HEAD").stdout.strip() == target
+
+
+class TestPushAheadSubmodules:
+    def test_pushes_only_ahead_instances(self, tmp_path: Path, capsys):
+        subs = [
+            SyncSubmodule(path=tmp_path / n, parent_repo=tmp_path, submodule_rel_path=n)
+            for n in ("a", "b", "c")
+        ]
+        ahead = {tmp_path / "b": ("main", "2")}
+        pushed = subprocess.CompletedProcess(args=[], returncode=0)
+
+        with (
+            patch(
+                "grove.sync._ahead_of_origin",
+                side_effect=lambda s, full_fetch: ahead.get(s.path),
+            ),
+            patch("grove.sync.run_git", return_value=pushed) as mock_git,
+        ):
+            assert push_ahead_submodules(subs)
+
+        mock_git.assert_called_once()
+        assert mock_git.call_args.args[0] == tmp_path / "b"
+        assert "Pushed b (2 commits)" in capsys.readouterr().out
+
+
+class TestFetchParentRepos:
+    def test_shared_origin_fetched_once(self, tmp_path: Path):
+        """Clones of one origin should share a single network fetch."""
+        origin = tmp_path / "origin"
+        origin.mkdir()
+        _git(origin, "init", "-b", "main")
+        _git(origin, "config", "user.email", "test@example.com")
+        _git(origin, "config", "user.name", "Test User")
+        _git(origin, "commit", "--allow-empty", "-m", "init")
+        clones = []
+        for name in ("a", "b"):
+            subprocess.run(
+                ["git", "clone", "-q", str(origin), str(tmp_path / name)], check=True
+            )
+            clones.append(RepoInfo(path=tmp_path / name, repo_root=tmp_path))
+        _git(origin, "commit", "--allow-empty", "-m", "new")
+        head = _git(origin, "rev-parse", "HEAD").stdout.strip()
+
+        with patch("grove.sync._fetch", wraps=_fetch) as mock_fetch:
+            _fetch_parent_repos(clones, full_fetch=False)
+
+        assert mock_fetch.call_count == 1
+        for clone in clones:
+            tracked = _git(clone.path, "rev-parse", "origin/main").stdout.strip()
+            assert tracked == head
+
+
+class TestFetch:
+    def _sub(self, tmp_path: Path) -> SyncSubmodule:
+        return SyncSubmodule(
+            path=tmp_path, parent_repo=tmp_path, submodule_rel_path="sub"
+        )
+
+    def test_tagless_fetch_by_default(self, tmp_path: Path):
+        ok = subprocess.CompletedProcess(args=[], returncode=0)
+        with patch("grove.sync.run_git", return_value=ok) as mock_git:
+            _fetch(self._sub(tmp_path), "--all", "--quiet")
+
+        mock_git.assert_called_once_with(
+            tmp_path,
+            "fetch",
+            "--all",
+            "--quiet",
+            "--no-tags",
+            check=False,
+            capture=True,
+        )
+
+    def test_failed_fetch_not_retried(self, tmp_path: Path):
+        failed = subprocess.CompletedProcess(args=[], returncode=128)
+        with patch("grove.sync.run_git", return_value=failed) as mock_git:
+            result = _fetch(self._sub(tmp_path), "--all", "--quiet")
+
+        assert result is failed
+        mock_git.assert_called_once()
+
+    def test_full_fetch_includes_tags(self, tmp_path: Path):
+        ok = subprocess.CompletedProcess(args=[], returncode=0)
+        with patch("grove.sync.run_git", return_value=ok) as mock_git:
+            _fetch(self._sub(tmp_path), "origin", full=True)
+
+        assert mock_git.call_args.args == (tmp_path, "fetch", "origin")
+
+    def test_does_not_convert_to_partial_clone(
+        self, tmp_git_repo: Path, tmp_path: Path
+    ):
+        """A default fetch must leave an ordinary clone's config alone."""
+        remote = tmp_path / "remote.git"
+        _git(tmp_path, "init", "--bare", str(remote))
+        _git(tmp_git_repo, "remote", "add", "origin", str(remote))
+        _git(tmp_git_repo, "push", "-q", "origin", "HEAD")
+        repo = RepoInfo(path=tmp_git_repo, repo_root=tmp_git_repo)
+
+        assert _fetch(repo, "origin", "--quiet").returncode == 0
+        config = _git(tmp_git_repo, "config", "--list", "--local").stdout
+        assert "promisor" not in config
+        assert "partialclonefilter" not in config
+
+
+class TestCommitGroupUpdates:
+    def test_commits_from_single_change_listing(self, tmp_sibling_submodules: Path):
+        """Only changed paths are committed, without re-diffing them."""
+        root_path = tmp_sibling_submodules
+        docs_a = root_path / "docs-a"
+        (docs_a / "new.txt").write_text("new\n")
+        _git(docs_a, "add", "new.txt")
+        _git(docs_a, "commit", "-m", "Advance")
+        subs = [
+            SyncSubmodule(
+                path=root_path / n, parent_repo=root_path, submodule_rel_path=n
+            )
+            for n in ("docs-a", "docs-b")
+        ]
+        root = RepoInfo(path=root_path, repo_root=root_path)
+
+        with patch(
+            "grove.sync.commit_submodule_changes", wraps=commit_submodule_changes
+        ) as mock_commit:
+            committed = _commit_group_updates(subs, [root], "Sync", False, True)
+
+        assert committed == [root]
+        assert mock_commit.call_args.args[1] == ["docs-a"]
+        assert mock_commit.call_args.kwargs["check_changes"] is False
+
+    def test_commits_non_ascii_submodule_path(
+        self, tmp_sibling_submodules: Path, tmp_path: Path
+    ):
+        """Paths git would quote (core.quotePath) must still be committed."""
+        root_path = tmp_sibling_submodules
+        _git(root_path, "submodule", "add", str(tmp_path / "docs_a_origin"), "café")
+        _git(root_path, "commit", "-m", "Add café")
+        cafe = root_path / "café"
+        (cafe / "new.txt").write_text("new\n")
+        _git(cafe, "add", "new.txt")
+        _git(cafe, "commit", "-m", "Advance")
+        sub = SyncSubmodule(path=cafe, parent_repo=root_path, submodule_rel_path="café")
+        root = RepoInfo(path=root_path, repo_root=root_path)
+
+        committed = _commit_group_updates([sub], [root], "Sync", False, True)
+
+        assert committed == [root]
+        assert _git(root_path, "status", "--porcelain").stdout == ""
+
+
+class TestIterGitmodulesPaths:
+    def test_prunes_dependency_and_git_dirs(self, tmp_path: Path):
+        """.gitmodules files under pruned directories should not be yielded."""
+        (tmp_path / ".gitmodules").write_text("")
+        for rel in ["libs/a", "node_modules/pkg", ".git/modules/x", ".venv/src"]:
+            (tmp_path / rel).mkdir(parents=True)
+            (tmp_path / rel / ".gitmodules").write_text("")
+
+        paths = list(_iter_gitmodules_paths(tmp_path))
+
+        assert paths == [
+            tmp_path.resolve() / ".gitmodules",
+            tmp_path.resolve() / "libs" / "a" / ".gitmodules",
+        ]
@@ -4,6 +4,7 @@ import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
+from grove.repo_utils import run_git
 from grove.sync import discover_sync_submodules
 from grove.sync_merge import (
     SyncMergeState,
@@ -47,6 +48,7 @@ class TestSyncMergeState:
         assert loaded.base_commit == "abc1234"
         assert len(loaded.diverged_commits) == 2
         assert loaded.merged_sha is None
+        assert loaded == state
 
     def test_remove(self, tmp_path: Path):
         """remove() should delete the state file."""
@@ -90,6 +92,32 @@ class TestAttemptDivergenceMerge:
         output = capsys.readouterr().out
         assert "merge successful" in output.lower()
 
+    def test_skips_fetch_for_commits_already_in_workspace(
+        self, tmp_sync_group_diverged: Path
+    ):
+        root = tmp_sync_group_diverged
+        submodules = discover_sync_submodules(root, "common_origin")
+        # Give the workspace (first instance) every diverged commit up front.
+        workspace = submodules[0].path
+        for sub in submodules[1:]:
+            _git(workspace, "fetch", str(sub.path), "HEAD")
+
+        with (
+            patch("grove.sync_merge.find_repo_root", return_value=root),
+            patch("grove.sync_merge.run_git", wraps=run_git) as mock_git,
+        ):
+            result = attempt_divergence_merge(
+                "common",
+                submodules,
+                root,
+                standalone_repo=None,
+                dry_run=False,
+                force=False,
+            )
+
+        assert result is not None
+        assert not any(c.args[1] == "fetch" for c in mock_git.call_args_list)
+
     def test_dry_run_returns_placeholder(
         self,
         tmp_sync_group_diverged: Path,
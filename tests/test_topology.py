@@ -1,6 +1,12 @@
 """Tests for grove.topology."""
 
+import subprocess
+from dataclasses import FrozenInstanceError, asdict
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
 
 from grove.topology import (
     DEFAULT_MAX_SNAPSHOTS,
@@ -72,6 +78,19 @@ class TestSubmoduleEntry:
         e = _entry()
         assert e.relative_url is None
 
+    def test_is_immutable(self):
+        e = _entry()
+        with pytest.raises(FrozenInstanceError):
+            e.commit = "def5678"
+
+    def test_to_dict_matches_asdict(self):
+        e = _entry(relative_url="../sub.git")
+        assert e.to_dict() == asdict(e)
+
+    def test_from_dict_round_trip(self):
+        e = _entry(relative_url="../sub.git")
+        assert SubmoduleEntry.from_dict(e.to_dict()) == e
+
 
 # ---------------------------------------------------------------------------
 # compute_topology_hash
@@ -214,6 +233,16 @@ class TestDiffSnapshots:
         assert len(d.removed) == 1
         assert d.removed[0].rel_path == "c"
 
+    def test_results_sorted_by_path(self):
+        s1 = _snap(entries=[_entry(rel_path=p) for p in ["z", "c", "a", "m"]])
+        s2 = _snap(
+            entries=[_entry(rel_path=p, commit="9") for p in ["y", "m", "b", "c"]]
+        )
+        d = diff_snapshots(s1, s2)
+        assert [e.rel_path for e in d.added] == ["b", "y"]
+        assert [e.rel_path for e in d.removed] == ["a", "z"]
+        assert [o.rel_path for o, _ in d.changed_commit] == ["c", "m"]
+
 
 # ---------------------------------------------------------------------------
 # TopologyCache
@@ -359,12 +388,68 @@ class TestTopologyCache:
         cache.prune(max_entries=10)
         assert len(cache.snapshots) == 1
 
+    def test_prune_to_zero(self, tmp_path: Path):
+        cache = TopologyCache(tmp_path / "topo.json")
+        cache.snapshots.append(_snap(root_commit="a"))
+        cache.prune(max_entries=0)
+        assert cache.snapshots == []
+
+    def test_get_sees_appended_and_pruned_snapshots(self, tmp_path: Path):
+        cache = TopologyCache(tmp_path / "topo.json")
+        cache.snapshots.append(_snap(root_commit="a"))
+        assert cache.get("b") is None
+        cache.snapshots.append(_snap(root_commit="b"))
+        assert cache.get("b") is cache.snapshots[-1]
+        cache.prune(max_entries=1)
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+    def test_get_after_record_and_prune_at_cap(self, tmp_path: Path):
+        """Recording at the cap then pruning keeps the length unchanged; the
+        index must still see the new snapshot and drop the evicted one."""
+        cache = TopologyCache(tmp_path / "topo.json")
+        for i in range(3):
+            cache.snapshots.append(_snap(root_commit=str(i)))
+        assert cache.get("0") is not None
+
+        with patch("grove.topology.build_entries", return_value=[]):
+            assert cache.record("new", [], tmp_path)
+        cache.prune(max_entries=3)
+
+        assert cache.get("new") is cache.snapshots[-1]
+        assert cache.get("0") is None
+
     def test_record_skips_duplicate(self, tmp_path: Path):
         cache = TopologyCache(tmp_path / "topo.json")
         cache.snapshots.append(_snap(root_commit="abc"))
-        cache.record("abc", [], tmp_path)
+        assert cache.record("abc", [], tmp_path) is False
         assert len(cache.snapshots) == 1
 
+    def test_record_reuses_hash_when_structure_unchanged(self, tmp_path: Path):
+        cache = TopologyCache(tmp_path / "topo.json")
+        cache.snapshots.append(_snap(root_commit="a", entries=[_entry(commit="111")]))
+        moved = [_entry(commit="222")]
+
+        with (
+            patch("grove.topology.build_entries", return_value=moved),
+            patch("grove.topology.compute_topology_hash") as mock_hash,
+        ):
+            assert cache.record("b", [], tmp_path)
+
+        mock_hash.assert_not_called()
+        assert cache.get("b").topology_hash == cache.get("a").topology_hash
+
+    def test_record_rehashes_changed_structure(self, tmp_path: Path):
+        cache = TopologyCache(tmp_path / "topo.json")
+        cache.snapshots.append(_snap(root_commit="a", entries=[_entry()]))
+        grown = [_entry(), _entry(rel_path="other")]
+
+        with patch("grove.topology.build_entries", return_value=grown):
+            assert cache.record("b", [], tmp_path)
+
+        assert cache.get("b").topology_hash == compute_topology_hash(grown)
+        assert cache.get("b").topology_hash != cache.get("a").topology_hash
+
     def test_save_creates_parent_dirs(self, tmp_path: Path):
         cache_path = tmp_path / "deep" / "nested" / "topo.json"
         cache = TopologyCache(cache_path)
@@ -464,6 +549,35 @@ class TestBuildEntries:
         for e in entries:
             assert e.url != ""
 
+    def test_parent_lookups_shared_by_siblings(self, tmp_path: Path):
+        """Relative URLs of siblings resolve against one origin lookup."""
+        (tmp_path / ".gitmodules").write_text(
+            '[submodule "a"]\n\tpath = a\n\turl = ../a.git\n'
+            '[submodule "b"]\n\tpath = b\n\turl = ../b.git\n'
+        )
+        root = SimpleNamespace(path=tmp_path, parent=None)
+        repos = [
+            root,
+            SimpleNamespace(path=tmp_path / "a", parent=root),
+            SimpleNamespace(path=tmp_path / "b", parent=root),
+        ]
+
+        def fake_git(cwd, *args, check=True):
+            out = (
+                "git@github.com:Org/root.git\n" if args[0] == "remote" else "abc1234\n"
+            )
+            return subprocess.CompletedProcess(args, 0, stdout=out)
+
+        with patch("grove.topology.run_git", side_effect=fake_git) as mock_git:
+            entries = build_entries(repos, tmp_path)
+
+        assert [e.url for e in entries] == [
+            "git@github.com:Org/a.git",
+            "git@github.com:Org/b.git",
+        ]
+        remote_calls = [c for c in mock_git.call_args_list if c.args[1] == "remote"]
+        assert len(remote_calls) == 1
+
 
 # ---------------------------------------------------------------------------
 # TopologyCache.record (integration)
@@ -480,7 +594,7 @@ class TestTopologyCacheRecord:
         result = run_git(tmp_submodule_tree, "rev-parse", "--short", "HEAD")
         root_commit = result.stdout.strip()
 
-        cache.record(root_commit, repos, tmp_submodule_tree)
+        assert cache.record(root_commit, repos, tmp_submodule_tree)
         assert len(cache.snapshots) == 1
 
         snap = cache.get(root_commit)